@@ -1,19 +1,38 @@
 # File: src/linkml_toolkit/__init__.py
 """LinkML Toolkit - A simple toolkit for working with LinkML schemas."""
 
-from importlib.metadata import version
+import importlib
 
 try:
-    __version__ = version("linkml_toolkit")
-except Exception:
+    # Written by setuptools_scm at build time (see pyproject.toml)
+    from ._version import __version__
+except ImportError:
     __version__ = "unknown"
 
-from .core import LinkMLProcessor
-from .validation import SchemaValidator
-from .export import SchemaExporter
+# Public names and the submodule defining them. Submodules pull in the linkml
+# runtime and generators, so they are only imported on first attribute access.
+_LAZY_ATTRS = {
+    "LinkMLProcessor": ".core",
+    "SchemaValidator": ".validation",
+    "SchemaExporter": ".export",
+}
 
 __all__ = [
     "LinkMLProcessor",
     "SchemaValidator",
     "SchemaExporter",
 ]
+
+
+def __getattr__(name):
+    """Import public classes lazily (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,21 +1,185 @@
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-from rich import box
+import functools
+import heapq
 from pathlib import Path
 import logging
 import sys
 import json
-from typing import List, Optional, Dict, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, List, Optional, Dict, Union
 from datetime import datetime
 
-from .core import LinkMLProcessor
-from .validation import SchemaValidator
-from .export import SchemaExporter
-from .visualization.core import SchemaVisualizer, VisualizationConfig
+# The toolkit modules pull in the linkml stack, which takes seconds to import.
+# Commands import them in their bodies so --help and usage errors stay fast.
+if TYPE_CHECKING:
+    from .core import LinkMLProcessor
+
+# Same keys as SchemaExporter.REPOSITORY_PREFIX_FIELDS, without importing export
+REPOSITORY_CHOICES = ["ena"]
+
+# Schema sections reported by analyze, in display order
+_ANALYSIS_SECTIONS = ("classes", "slots", "enums", "types", "subsets")
+
+# Tables longer than this are printed as plain text (see _fill_table)
+PLAIN_TABLE_MIN_ROWS = 500
+
+_ERROR_MARKUP = "[red]ERROR[/red]"
+_WARNING_MARKUP = "[yellow]WARNING[/yellow]"
+
+# Attributes already shown by each display helper, left out of "Additional Properties"
+_CLASS_EXCLUDED_ATTRS = frozenset({"name", "description", "is_a", "mixins", "abstract", "slots"})
+_SLOT_EXCLUDED_ATTRS = frozenset(
+    {
+        "name",
+        "description",
+        "range",
+        "required",
+        "multivalued",
+        "pattern",
+        "min_value",
+        "max_value",
+        "usage",
+        "annotations",
+        "examples",
+    }
+)
+_ENUM_EXCLUDED_ATTRS = frozenset({"name", "description", "permissible_values"})
+_SCHEMA_EXCLUDED_ATTRS = frozenset(
+    {"name", "version", "description", "prefixes", "classes", "slots", "enums", "types", "subsets"}
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Return the shared Rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console(force_terminal=sys.stdout.isatty(), highlight=False)
+
+
+def _ctx_flags():
+    """Return the (quiet, strict) flags set on the main command group."""
+    obj = click.get_current_context().obj
+    return obj.get("quiet", False), obj.get("strict", False)
+
+
+def _eprint(message: str):
+    """Print an error message to stderr in red without going through rich."""
+    click.secho(message, fg="red", err=True)
+
+
+def _step(what: str, func, *args, **kwargs):
+    """Run one step of a command, reporting a failure as 'Error <what>: ...' and exiting."""
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        _eprint(f"Error {what}: {e}")
+        sys.exit(1)
+
+
+def _print_success(message: str):
+    """Print a success message, bypassing rich entirely when stdout is not a terminal."""
+    if sys.stdout.isatty():
+        _get_console().print(f"[green]{message}[/green]")
+    else:
+        click.echo(message)
+
+
+def _resolve_schema_path(schema: str) -> str:
+    """
+    Resolve a --schema argument to a file path, reading '-' from stdin.
+
+    Piped schemas are spooled to a temporary file that is removed when the
+    command finishes, since the loaders and generators all expect a path.
+    """
+    ctx = click.get_current_context()
+    if schema == "-":
+        import os
+        import tempfile
+
+        from .utils import STDIN_SPOOL_PREFIX
 
-console = Console()
+        fd, tmp_name = tempfile.mkstemp(prefix=STDIN_SPOOL_PREFIX, suffix=".yaml")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(sys.stdin.read())
+        ctx.call_on_close(lambda: os.unlink(tmp_name))
+        return tmp_name
+    if not Path(schema).exists():
+        raise click.BadParameter(f"Path '{schema}' does not exist.", param_hint="'--schema'")
+    return schema
+
+
+def _append_validation_errors(lines: List[str], errors) -> int:
+    """
+    Append markup lines for validation errors to lines in a single pass.
+
+    Returns:
+        int: Number of errors with ERROR severity
+    """
+    error_count = 0
+    for error in errors:
+        is_error = error.severity == "ERROR"
+        error_count += is_error
+        lines.append(f"{_ERROR_MARKUP if is_error else _WARNING_MARKUP}: {error.message}")
+        details = error.details
+        if details:
+            lines.extend(f"  {key}: {value}" for key, value in details.items())
+    return error_count
+
+
+def _json_bytes(data, compact: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON in one pass, turning non-JSON values into strings.
+
+    Uses orjson when it is installed, which is several times faster than the
+    standard library on large nested results.
+    """
+    try:
+        import orjson
+    except ImportError:
+        if compact:
+            text = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+        else:
+            text = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+        return text.encode("utf-8")
+
+    option = orjson.OPT_NON_STR_KEYS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, option=option, default=str)
+
+
+def _extra_attrs(info: Dict, excluded: frozenset, skip_none: bool = True):
+    """Yield the (key, value) pairs of info not covered by the excluded attributes."""
+    for key, value in info.items():
+        if key in excluded or key.startswith("_") or (skip_none and value is None):
+            continue
+        yield key, value
+
+
+def _fill_table(table, rows: List[tuple]):
+    """
+    Return the table filled with rows, or plain fixed-width text for very long tables.
+
+    Rich's column layout pass dominates rendering time once a table has many
+    hundreds of rows, so those are printed as pre-formatted columns instead.
+    """
+    if len(rows) <= PLAIN_TABLE_MIN_ROWS:
+        for row in rows:
+            table.add_row(*row)
+        return table
+
+    from rich.text import Text
+
+    headers = [str(column.header) for column in table.columns]
+    widths = [
+        max([len(header)] + [len(str(row[i])) for row in rows]) for i, header in enumerate(headers)
+    ]
+    lines = ["  ".join(h.ljust(w) for h, w in zip(headers, widths)).rstrip()]
+    lines.extend(
+        "  ".join(str(cell).ljust(w) for cell, w in zip(row, widths)).rstrip() for row in rows
+    )
+    return Text("\n".join(lines))
 
 
 def setup_logging(quiet: bool):
@@ -28,13 +192,18 @@ def setup_logging(quiet: bool):
 
 def display_class_info(info: Dict, detailed: bool = False):
     """Display information about a class in a well-formatted manner."""
-    console = Console()
+    from rich.console import Group
+    from rich.table import Table
+    from rich import box
+
+    # Collect everything and print once; each console.print re-renders markup
+    renderables = []
     table = Table(show_header=False, box=box.SIMPLE)
     table.add_column("Attribute", style="cyan")
     table.add_column("Value", style="white")
 
     # Class name and description
-    console.print(f"\n[bold blue]Class: {info.get('name', 'Unknown')}[/bold blue]")
+    renderables.append(f"\n[bold blue]Class: {info.get('name', 'Unknown')}[/bold blue]")
 
     # Add description if exists
     if info.get("description"):
@@ -52,64 +221,62 @@ def display_class_info(info: Dict, detailed: bool = False):
     table.add_row("[bold]Abstract[/bold]", "Yes" if info.get("abstract") else "No")
 
     # Render table of essential info
-    console.print(table)
+    renderables.append(table)
 
     # Slots section
     if info.get("slots"):
-        console.print("\n[bold]Slots:[/bold]")
+        renderables.append("\n[bold]Slots:[/bold]")
         slots_table = Table(show_header=True, header_style="bold magenta")
         slots_table.add_column("Name", style="cyan")
         slots_table.add_column("Range", style="green")
         slots_table.add_column("Required", style="yellow")
         slots_table.add_column("Inherited", style="red")
 
-        for slot_name, slot_info in info["slots"].items():
-            slots_table.add_row(
+        rows = [
+            (
                 slot_name,
                 slot_info.get("range", "N/A"),
                 "✓" if slot_info.get("required") else "✗",
                 "✓" if slot_info.get("inherited") else "✗",
             )
-
-        console.print(slots_table)
+            for slot_name, slot_info in info["slots"].items()
+        ]
+        renderables.append(_fill_table(slots_table, rows))
 
     # Detailed mode additional information
     if detailed:
-        detailed_table = Table(show_header=False, box=box.SIMPLE)
-        detailed_table.add_column("Attribute", style="cyan")
-        detailed_table.add_column("Value", style="white")
-
         # Collect and display additional properties
-        excluded_attrs = {"name", "description", "is_a", "mixins", "abstract", "slots"}
-        remaining_attrs = {
-            k: v
-            for k, v in info.items()
-            if k not in excluded_attrs and not k.startswith("_") and v is not None
-        }
+        rows = [(key, str(value)) for key, value in _extra_attrs(info, _CLASS_EXCLUDED_ATTRS)]
 
-        if remaining_attrs:
-            console.print("\n[bold]Additional Properties:[/bold]")
-            for key, value in remaining_attrs.items():
-                detailed_table.add_row(key, str(value))
+        if rows:
+            renderables.append("\n[bold]Additional Properties:[/bold]")
+            detailed_table = Table(show_header=False, box=box.SIMPLE)
+            detailed_table.add_column("Attribute", style="cyan")
+            detailed_table.add_column("Value", style="white")
+            for row in rows:
+                detailed_table.add_row(*row)
+            renderables.append(detailed_table)
 
-            console.print(detailed_table)
+    renderables.append("")
 
-    console.print()
+    _get_console().print(Group(*renderables))
 
 
 def display_slot_info(info: Dict, detailed: bool = False):
     """Display information about a slot in a well-formatted manner."""
-    console = Console()
-    table = Table(show_header=False, box=box.SIMPLE)
-    table.add_column("Attribute", style="cyan")
-    table.add_column("Value", style="white")
+    from rich.console import Group
+    from rich.table import Table
+    from rich import box
+
+    renderables = []
+    primary_rows = []
 
     # Slot name and description
-    console.print(f"\n[bold blue]Slot: {info.get('name', 'Unknown')}[/bold blue]")
+    renderables.append(f"\n[bold blue]Slot: {info.get('name', 'Unknown')}[/bold blue]")
 
     # Add description if exists
     if info.get("description"):
-        table.add_row("[bold]Description[/bold]", info["description"])
+        primary_rows.append(("[bold]Description[/bold]", info["description"]))
 
     # Primary attributes
     primary_attrs = [
@@ -128,7 +295,7 @@ def display_slot_info(info: Dict, detailed: bool = False):
                 value = "N/A"
             else:
                 value = str(raw_value)
-            table.add_row(f"[bold]{label}[/bold]", value)
+            primary_rows.append((f"[bold]{label}[/bold]", value))
 
     # Value constraints
     constraints = []
@@ -138,34 +305,44 @@ def display_slot_info(info: Dict, detailed: bool = False):
         constraints.append(f"Maximum: {info['max_value']}")
 
     if constraints:
-        table.add_row("[bold]Value Constraints[/bold]", ", ".join(constraints))
+        primary_rows.append(("[bold]Value Constraints[/bold]", ", ".join(constraints)))
 
-    # Render primary info table
-    console.print(table)
+    # Render primary info table, skipped when the slot has none of these attributes
+    if primary_rows:
+        table = Table(show_header=False, box=box.SIMPLE)
+        table.add_column("Attribute", style="cyan")
+        table.add_column("Value", style="white")
+        for row in primary_rows:
+            table.add_row(*row)
+        renderables.append(table)
 
     # Usage information
     if "usage" in info and info["usage"]:
-        console.print("\n[bold]Used in Classes:[/bold]")
+        renderables.append("\n[bold]Used in Classes:[/bold]")
         usage_table = Table(show_header=True, header_style="bold magenta")
         usage_table.add_column("Class", style="cyan")
         usage_table.add_column("Inherited", style="red")
         usage_table.add_column("Overrides", style="green")
 
-        for class_name, usage in info["usage"].items():
-            overrides = (
-                ", ".join(f"{k}: {v}" for k, v in usage.get("overrides", {}).items())
-                if usage.get("overrides")
-                else "N/A"
+        rows = [
+            (
+                class_name,
+                "✓" if usage.get("inherited") else "✗",
+                (
+                    ", ".join(f"{k}: {v}" for k, v in usage["overrides"].items())
+                    if usage.get("overrides")
+                    else "N/A"
+                ),
             )
-            usage_table.add_row(class_name, "✓" if usage.get("inherited") else "✗", overrides)
-
-        console.print(usage_table)
+            for class_name, usage in info["usage"].items()
+        ]
+        renderables.append(_fill_table(usage_table, rows))
 
     # Detailed mode additional information
     if detailed:
         # Annotations
         if info.get("annotations"):
-            console.print("\n[bold]Annotations:[/bold]")
+            renderables.append("\n[bold]Annotations:[/bold]")
             annotations_table = Table(show_header=True, header_style="bold magenta")
             annotations_table.add_column("Key", style="cyan")
             annotations_table.add_column("Value", style="white")
@@ -173,11 +350,11 @@ def display_slot_info(info: Dict, detailed: bool = False):
             for key, value in info["annotations"].items():
                 annotations_table.add_row(str(key), str(value))
 
-            console.print(annotations_table)
+            renderables.append(annotations_table)
 
         # Examples
         if info.get("examples"):
-            console.print("\n[bold]Examples:[/bold]")
+            renderables.append("\n[bold]Examples:[/bold]")
             examples_table = Table(show_header=True, header_style="bold magenta")
             examples_table.add_column("Example", style="white")
 
@@ -187,58 +364,55 @@ def display_slot_info(info: Dict, detailed: bool = False):
                 else:
                     examples_table.add_row(str(example))
 
-            console.print(examples_table)
+            renderables.append(examples_table)
 
         # Additional properties
-        additional_attrs = {
-            k: v
-            for k, v in info.items()
-            if k
-            not in {
-                "name",
-                "description",
-                "range",
-                "required",
-                "multivalued",
-                "pattern",
-                "min_value",
-                "max_value",
-                "usage",
-                "annotations",
-                "examples",
-            }
-            and not k.startswith("_")
-            and v is not None
-        }
-
-        if additional_attrs:
-            console.print("\n[bold]Additional Properties:[/bold]")
+        rows = [(str(key), str(value)) for key, value in _extra_attrs(info, _SLOT_EXCLUDED_ATTRS)]
+
+        if rows:
+            renderables.append("\n[bold]Additional Properties:[/bold]")
             additional_table = Table(show_header=True, header_style="bold magenta")
             additional_table.add_column("Attribute", style="cyan")
             additional_table.add_column("Value", style="white")
+            for row in rows:
+                additional_table.add_row(*row)
+            renderables.append(additional_table)
+
+    renderables.append("")
 
-            for key, value in additional_attrs.items():
-                additional_table.add_row(str(key), str(value))
+    _get_console().print(Group(*renderables))
 
-            console.print(additional_table)
 
-    console.print()
+def _enum_value_row(value_name: str, value_info, detailed: bool = False) -> tuple:
+    """Build the permissible-values table row for a single enum value."""
+    if not (detailed and isinstance(value_info, dict)):
+        return (value_name,)
+
+    # Collect any other meaningful info
+    additional_info = (
+        ", ".join(f"{k}: {v}" for k, v in value_info.items() if k not in {"name", "description"})
+        or "N/A"
+    )
+    return value_name, value_info.get("description", "N/A"), additional_info
 
 
 def display_enum_info(info: Dict, detailed: bool = False):
     """Display information about an enum in a well-formatted manner."""
-    console = Console()
+    from rich.console import Group
+    from rich.table import Table
+
+    renderables = []
 
     # Enum name and description
-    console.print(f"\n[bold blue]Enum: {info.get('name', 'Unknown')}[/bold blue]")
+    renderables.append(f"\n[bold blue]Enum: {info.get('name', 'Unknown')}[/bold blue]")
 
     # Description
     if info.get("description"):
-        console.print(f"\n[bold]Description:[/bold]\n{info['description']}")
+        renderables.append(f"\n[bold]Description:[/bold]\n{info['description']}")
 
     # Permissible Values
     if info.get("permissible_values"):
-        console.print("\n[bold]Permissible Values:[/bold]")
+        renderables.append("\n[bold]Permissible Values:[/bold]")
         values_table = Table(show_header=True, header_style="bold magenta")
         values_table.add_column("Value", style="cyan")
 
@@ -247,63 +421,44 @@ def display_enum_info(info: Dict, detailed: bool = False):
             values_table.add_column("Description", style="white")
             values_table.add_column("Additional Info", style="green")
 
-        for value_name, value_info in info["permissible_values"].items():
-            if detailed and isinstance(value_info, dict):
-                # Prepare additional info columns
-                description = value_info.get("description", "N/A")
-
-                # Collect any other meaningful info
-                additional_info = (
-                    ", ".join(
-                        f"{k}: {v}"
-                        for k, v in value_info.items()
-                        if k not in {"name", "description"}
-                    )
-                    or "N/A"
-                )
-
-                values_table.add_row(value_name, description, additional_info)
-            else:
-                values_table.add_row(value_name)
-
-        console.print(values_table)
+        rows = [
+            _enum_value_row(value_name, value_info, detailed)
+            for value_name, value_info in info["permissible_values"].items()
+        ]
+        renderables.append(_fill_table(values_table, rows))
 
     # Detailed mode additional properties
     if detailed:
         # Collect additional attributes
-        additional_attrs = {
-            k: v
-            for k, v in info.items()
-            if k not in {"name", "description", "permissible_values"}
-            and not k.startswith("_")
-            and v is not None
-        }
-
-        if additional_attrs:
-            console.print("\n[bold]Additional Properties:[/bold]")
+        rows = [(str(key), str(value)) for key, value in _extra_attrs(info, _ENUM_EXCLUDED_ATTRS)]
+
+        if rows:
+            renderables.append("\n[bold]Additional Properties:[/bold]")
             additional_table = Table(show_header=True, header_style="bold magenta")
             additional_table.add_column("Attribute", style="cyan")
             additional_table.add_column("Value", style="white")
+            for row in rows:
+                additional_table.add_row(*row)
+            renderables.append(additional_table)
 
-            for key, value in additional_attrs.items():
-                additional_table.add_row(str(key), str(value))
-
-            console.print(additional_table)
+    renderables.append("")
 
-    console.print()
+    _get_console().print(Group(*renderables))
 
 
-def display_hierarchy(results: Dict, processor: LinkMLProcessor):
+def display_hierarchy(results: Dict, processor: "LinkMLProcessor"):
     """Display schema hierarchy as a tree."""
-    console = Console()
+    from rich.tree import Tree
+
     tree = Tree("[bold]Schema Class Hierarchy[/bold]")
 
-    def add_class_node(parent_tree, class_name):
-        """Add a class node to the tree with appropriate styling."""
-        class_def = processor.schema_view.get_class(class_name)
-        if not class_def:
-            return
+    # Index parent -> children once instead of scanning every class per node
+    children = defaultdict(list)
+    for class_name, class_def in processor.schema_view.all_classes().items():
+        children[getattr(class_def, "is_a", None) or None].append((class_name, class_def))
 
+    def add_class_node(parent_tree, class_name, class_def):
+        """Add a class node to the tree with appropriate styling."""
         # Determine node style based on class type
         if getattr(class_def, "mixin", False):
             style = "yellow italic"
@@ -318,34 +473,65 @@ def display_hierarchy(results: Dict, processor: LinkMLProcessor):
         node = parent_tree.add(f"[{style}]{class_name}{suffix}[/{style}]")
 
         # Add child classes
-        for child_name, child_def in processor.schema_view.all_classes().items():
-            if getattr(child_def, "is_a", None) == class_name:
-                add_class_node(node, child_name)
+        for child_name, child_def in children.get(class_name, ()):
+            add_class_node(node, child_name, child_def)
 
     # Start with root classes (those without is_a)
-    root_classes = []
-    for class_name, class_def in processor.schema_view.all_classes().items():
-        if not getattr(class_def, "is_a", None):
-            root_classes.append(class_name)
+    for root, root_def in sorted(children[None], key=lambda item: item[0]):
+        add_class_node(tree, root, root_def)
 
-    # Add root classes to tree
-    for root in sorted(root_classes):
-        add_class_node(tree, root)
+    _get_console().print(tree)
 
-    console.print(tree)
+
+def _summary_rows(results: Dict, detailed: bool = False):
+    """Yield pre-formatted (section, count, items) rows for the schema summary table."""
+    for section in _ANALYSIS_SECTIONS:
+        if section in results:
+            # Iterating a dict yields its keys, so both shapes are handled the same way
+            items = results[section]
+            count = len(items)
+            if count == 0:
+                names = "none"
+            elif detailed:
+                names = "\n".join(f"• {name}" for name in sorted(items))
+            elif count > 5:
+                # Show only first 5 items in summary mode; no need to sort them all
+                names = f"{', '.join(heapq.nsmallest(5, items))} (and {count - 5} more...)"
+            else:
+                names = ", ".join(sorted(items))
+
+            yield section.capitalize(), str(count), names
+
+
+def _echo_summary_tsv(results: Dict):
+    """Write the schema summary as tab-separated Section/Count/Items lines."""
+    lines = ["Section\tCount\tItems"]
+    for section in _ANALYSIS_SECTIONS:
+        if section in results:
+            names = list(results[section])
+            lines.append(f"{section.capitalize()}\t{len(names)}\t{','.join(names)}")
+    click.echo("\n".join(lines))
 
 
 def display_schema_analysis(results: Dict, detailed: bool = False):
     """Display schema analysis results in a well-formatted manner."""
-    console = Console()
+    if not sys.stdout.isatty():
+        # Redirected output is meant for other tools; skip rich's table layout
+        _echo_summary_tsv(results)
+        return
+
+    from rich.console import Group
+    from rich.table import Table
+
+    renderables = []
 
     # Schema metadata
-    console.print(f"\n[bold blue]Schema:[/bold blue] {results.get('name', 'Unknown')}")
+    renderables.append(f"\n[bold blue]Schema:[/bold blue] {results.get('name', 'Unknown')}")
     if results.get("version"):
-        console.print(f"[bold]Version:[/bold] {results['version']}")
+        renderables.append(f"[bold]Version:[/bold] {results['version']}")
 
     if results.get("description"):
-        console.print(f"\n[bold]Description:[/bold]\n{results['description']}")
+        renderables.append(f"\n[bold]Description:[/bold]\n{results['description']}")
 
     # Create summary table
     table = Table(show_header=True)
@@ -353,80 +539,54 @@ def display_schema_analysis(results: Dict, detailed: bool = False):
     table.add_column("Count", justify="right", style="green")
     table.add_column("Items", style="yellow")
 
-    # Add sections to table
-    sections = ["classes", "slots", "enums", "types", "subsets"]
-    for section in sections:
-        if section in results:
-            items = results[section]
-            if isinstance(items, dict):
-                count = len(items)
-                if count > 0:
-                    if detailed:
-                        names = "\n".join(f"• {name}" for name in sorted(items.keys()))
-                    else:
-                        # Show only first 5 items in summary mode
-                        sorted_items = sorted(items.keys())
-                        if len(sorted_items) > 5:
-                            names = (
-                                ", ".join(sorted_items[:5])
-                                + f" (and {len(sorted_items)-5} more...)"
-                            )
-                        else:
-                            names = ", ".join(sorted_items)
-            else:
-                count = len(items)
-                if count > 0:
-                    if detailed:
-                        names = "\n".join(f"• {name}" for name in sorted(items))
-                    else:
-                        # Show only first 5 items in summary mode
-                        sorted_items = sorted(items)
-                        if len(sorted_items) > 5:
-                            names = (
-                                ", ".join(sorted_items[:5])
-                                + f" (and {len(sorted_items)-5} more...)"
-                            )
-                        else:
-                            names = ", ".join(sorted_items)
-
-            table.add_row(section.capitalize(), str(count), names if count > 0 else "none")
-
-    console.print("\n")
-    console.print(table)
+    for row in _summary_rows(results, detailed):
+        table.add_row(*row)
+
+    renderables.append("\n")
+    renderables.append(table)
 
     # Additional metadata only in detailed mode
     if detailed and results.get("prefixes"):
-        console.print("\n[bold]Prefixes:[/bold]")
+        renderables.append("\n[bold]Prefixes:[/bold]")
         for prefix, uri in results["prefixes"].items():
-            console.print(f"  {prefix}: {uri}")
+            renderables.append(f"  {prefix}: {uri}")
 
     if detailed:
-        excluded_attrs = {
-            "name",
-            "version",
-            "description",
-            "prefixes",
-            "classes",
-            "slots",
-            "enums",
-            "types",
-            "subsets",
-        }
-        remaining_attrs = {
-            k: v for k, v in results.items() if k not in excluded_attrs and not k.startswith("_")
-        }
-
-        if remaining_attrs:
-            console.print("\n[bold]Additional Metadata:[/bold]")
-            for key, value in remaining_attrs.items():
-                if isinstance(value, dict):
-                    console.print(f"\n  [cyan]{key}:[/cyan]")
-                    for k, v in value.items():
-                        console.print(f"    {k}: {v}")
-                else:
-                    console.print(f"  [cyan]{key}:[/cyan] {value}")
+        metadata = []
+        for key, value in _extra_attrs(results, _SCHEMA_EXCLUDED_ATTRS, skip_none=False):
+            if isinstance(value, dict):
+                metadata.append(f"\n  [cyan]{key}:[/cyan]")
+                metadata.extend(f"    {k}: {v}" for k, v in value.items())
+            else:
+                metadata.append(f"  [cyan]{key}:[/cyan] {value}")
+
+        if metadata:
+            renderables.append("\n[bold]Additional Metadata:[/bold]")
+            renderables.extend(metadata)
+
+    renderables.append("")
+
+    _get_console().print(Group(*renderables))
+
 
-    console.print()
+# analyze --entity handlers: (analyze(processor, name, include_inherited), display, label)
+_ENTITY_DISPATCH = {
+    "class": (
+        lambda processor, name, include_inherited: processor.analyze_class(name, include_inherited),
+        display_class_info,
+        "Class",
+    ),
+    "slot": (
+        lambda processor, name, include_inherited: processor.analyze_slot(name),
+        display_slot_info,
+        "Slot",
+    ),
+    "enum": (
+        lambda processor, name, include_inherited: processor.analyze_enum(name),
+        display_enum_info,
+        "Enum",
+    ),
+}
 
 
 @click.group()
@@ -445,9 +605,9 @@ def main(quiet, strict):
 @main.command()
 @click.option(
     "--schema",
-    type=click.Path(exists=True),
+    type=click.Path(allow_dash=True),
     required=True,
-    help="Path to the LinkML schema file",
+    help="Path to the LinkML schema file ('-' reads from stdin)",
 )
 @click.option(
     "--entity",
@@ -462,7 +622,7 @@ def main(quiet, strict):
     "--section",
     "-s",
     multiple=True,
-    type=click.Choice(["classes", "slots", "enums", "types", "subsets"], case_sensitive=False),
+    type=click.Choice(_ANALYSIS_SECTIONS, case_sensitive=False),
     help="Sections to include in analysis (default: all)",
 )
 @click.option(
@@ -489,6 +649,11 @@ def main(quiet, strict):
     type=click.Path(),
     help="Save analysis to JSON file",
 )
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Write --output JSON without indentation (smaller and faster for large schemas)",
+)
 def analyze(
     schema,
     entity,
@@ -498,207 +663,121 @@ def analyze(
     include_inherited,
     tree,
     output,
+    compact,
 ):
     """Analyze a LinkML schema or specific elements within it."""
-    try:
-        ctx = click.get_current_context()
-        quiet = ctx.obj.get("quiet", False)
-        strict = ctx.obj.get("strict", False)
-
-        # Validate schema loading
-        try:
-            processor = LinkMLProcessor(schema, validate=True, strict=strict)
-            errors = processor.validator.validate_schema(schema)
-            if errors:
-                for error in errors:
-                    severity = (
-                        "[red]ERROR[/red]"
-                        if error.severity == "ERROR"
-                        else "[yellow]WARNING[/yellow]"
-                    )
-                    console.print(f"{severity}: {error.message}")
-                    if error.details:
-                        for key, value in error.details.items():
-                            console.print(f"  {key}: {value}")
-                if strict:
-                    sys.exit(1)
-                else:
-                    console.print(
-                        "[yellow]WARNING:[/yellow] Continuing with analysis despite validation errors"
-                    )
-
-        except Exception as schema_load_error:
-            console.print(f"[red]Error loading schema:[/red] {str(schema_load_error)}")
+    from .core import LinkMLProcessor
+
+    schema = _resolve_schema_path(schema)
+    console = _get_console()
+    quiet, strict = _ctx_flags()
+
+    processor = _step("loading schema", LinkMLProcessor, schema, validate=True, strict=strict)
+    if processor.errors:
+        lines = []
+        _append_validation_errors(lines, processor.errors)
+        console.print("\n".join(lines))
+        if strict:
             sys.exit(1)
+        console.print(
+            "[yellow]WARNING:[/yellow] Continuing with analysis despite validation errors"
+        )
 
-        # Specific entity analysis
-        if entity and name:
-            if output or tree:
-                console.print(
-                    "[yellow]Warning:[/yellow] --output and --tree are ignored when "
-                    "--entity/--name are provided"
-                )
-            if include_inherited and entity.lower() != "class":
-                console.print(
-                    "[yellow]Warning:[/yellow] --include-inherited only applies to --entity class"
-                )
+    # Specific entity analysis
+    if entity and name:
+        if output or tree:
+            console.print(
+                "[yellow]Warning:[/yellow] --output and --tree are ignored when "
+                "--entity/--name are provided"
+            )
+        if include_inherited and entity.lower() != "class":
+            console.print(
+                "[yellow]Warning:[/yellow] --include-inherited only applies to --entity class"
+            )
 
-            # Map entity to appropriate analysis and display functions
-            entity_map = {
-                "class": {
-                    "analyze_func": lambda n: processor.analyze_class(n, include_inherited),
-                    "display_func": display_class_info,
-                    "not_found_msg": "Class",
-                },
-                "slot": {
-                    "analyze_func": processor.analyze_slot,
-                    "display_func": display_slot_info,
-                    "not_found_msg": "Slot",
-                },
-                "enum": {
-                    "analyze_func": processor.analyze_enum,
-                    "display_func": display_enum_info,
-                    "not_found_msg": "Enum",
-                },
-            }
-
-            try:
-                # Validate entity type
-                entity_handler = entity_map.get(entity.lower())
-                if not entity_handler:
-                    console.print(
-                        f"[red]Error:[/red] Invalid entity type '{entity}'. Choose from: class, slot, enum"
-                    )
-                    sys.exit(1)
-
-                # Attempt to analyze specific entity
-                try:
-                    info = entity_handler["analyze_func"](name)
-                except Exception as analyze_error:
-                    console.print(
-                        f"[red]Error analyzing {entity} '{name}':[/red] {str(analyze_error)}"
-                    )
-                    sys.exit(1)
-
-                # Validate and display entity information
-                if info:
-                    try:
-                        entity_handler["display_func"](info, detailed)
-                    except Exception as display_error:
-                        console.print(
-                            f"[red]Error displaying {entity} '{name}':[/red] {str(display_error)}"
-                        )
-                        sys.exit(1)
-                else:
-                    console.print(
-                        f"[red]Error:[/red] {entity_handler['not_found_msg']} '{name}' not found"
-                    )
-                    sys.exit(1)
+        entity_handler = _ENTITY_DISPATCH.get(entity.lower())
+        if not entity_handler:
+            _eprint(f"Error: Invalid entity type '{entity}'. Choose from: class, slot, enum")
+            sys.exit(1)
+        analyze_func, display_func, label = entity_handler
 
-            except Exception as entity_error:
-                console.print(f"[red]Error processing {entity} '{name}':[/red] {str(entity_error)}")
-                sys.exit(1)
+        what = f"{entity} '{name}'"
+        info = _step(f"analyzing {what}", analyze_func, processor, name, include_inherited)
+        if not info:
+            _eprint(f"Error: {label} '{name}' not found")
+            sys.exit(1)
+        _step(f"displaying {what}", display_func, info, detailed)
+        return
 
-        # Entire schema analysis
-        else:
-            try:
-                # Analyze schema sections
-                sections = list(section) if section else None
-                results = processor.analyze_schema(sections=sections, detailed=detailed)
-
-                # Display results
-                try:
-                    if tree:
-                        display_hierarchy(results, processor)
-                    else:
-                        display_schema_analysis(results, detailed)
-                except Exception as display_error:
-                    console.print(
-                        f"[red]Error displaying schema analysis:[/red] {str(display_error)}"
-                    )
-                    sys.exit(1)
-
-                # Optional output to JSON
-                if output:
-                    try:
-                        output_path = Path(output)
-
-                        # Prepare JSON-serializable results
-                        json_results = results.copy()
-                        json_results = json.loads(
-                            json.dumps(json_results, default=lambda o: str(o))
-                        )
-
-                        with open(output_path, "w", encoding="utf-8") as f:
-                            json.dump(json_results, f, indent=2, ensure_ascii=False)
-
-                        if not quiet:
-                            console.print(f"\n[green]Analysis saved as JSON to: {output}[/green]")
-                    except Exception as output_error:
-                        console.print(
-                            f"[red]Error saving output to JSON:[/red] {str(output_error)}"
-                        )
-                        sys.exit(1)
-
-            except Exception as schema_analysis_error:
-                console.print(f"[red]Error analyzing schema:[/red] {str(schema_analysis_error)}")
-                sys.exit(1)
+    # Entire schema analysis
+    sections = list(section) if section else None
+    results = _step(
+        "analyzing schema", processor.analyze_schema, sections=sections, detailed=detailed
+    )
 
-    except Exception as unexpected_error:
-        console.print(f"[red]Unexpected error:[/red] {str(unexpected_error)}")
-        sys.exit(1)
+    if tree:
+        _step("displaying schema analysis", display_hierarchy, results, processor)
+    else:
+        _step("displaying schema analysis", display_schema_analysis, results, detailed)
+
+    # Optional output to JSON
+    if output:
+        # Serialize before opening the file, so errors never leave it half-written
+        _step(
+            "saving output to JSON",
+            lambda: Path(output).write_bytes(_json_bytes(results, compact=compact)),
+        )
+        if not quiet:
+            _print_success(f"\nAnalysis saved as JSON to: {output}")
 
 
 @main.command()
 @click.option(
     "--schema",
-    type=click.Path(exists=True),
+    type=click.Path(allow_dash=True),
     required=True,
-    help="Path to the LinkML schema file",
+    help="Path to the LinkML schema file ('-' reads from stdin)",
 )
 @click.option("--metadata", is_flag=True, help="Show schema metadata")
 def validate(schema, metadata):
     """Validate a schema file."""
-    ctx = click.get_current_context()
-    quiet = ctx.obj.get("quiet", False)
-    strict = ctx.obj.get("strict", False)
+    from .core import LinkMLProcessor
+
+    schema = _resolve_schema_path(schema)
+    console = _get_console()
+    quiet, strict = _ctx_flags()
 
     try:
         processor = LinkMLProcessor(schema, validate=True, strict=strict)
-        errors = processor.validator.validate_schema(schema)
+        errors = processor.errors
 
         if errors:
-            for error in errors:
-                severity = (
-                    "[red]ERROR[/red]" if error.severity == "ERROR" else "[yellow]WARNING[/yellow]"
-                )
-                console.print(f"{severity}: {error.message}")
-                if error.details:
-                    for key, value in error.details.items():
-                        console.print(f"  {key}: {value}")
-            if strict or any(e.severity == "ERROR" for e in errors):
+            lines = []
+            error_count = _append_validation_errors(lines, errors)
+            console.print("\n".join(lines))
+            if strict or error_count:
                 sys.exit(1)
         elif not quiet:
-            console.print("[green]Schema validation passed - no errors found.[/green]")
+            _print_success("Schema validation passed - no errors found.")
 
     except Exception as e:
-        console.print(f"[red]Error:[/red] {str(e)}")
+        _eprint(f"Error: {str(e)}")
         sys.exit(1)
 
 
 @main.command()
 @click.option(
     "--schema",
-    type=click.Path(exists=True),
+    type=click.Path(allow_dash=True),
     required=True,
-    help="Path to the LinkML schema file",
+    help="Path to the LinkML schema file ('-' reads from stdin)",
 )
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["json", "rdf", "graphql", "csv", "tsv", "sql"]),
+    type=click.Choice(["json", "rdf", "graphql", "csv", "tsv", "sql", "all"]),
     required=True,
-    help="Output format",
+    help="Output format ('all' writes JSON Schema, RDF and GraphQL into the output directory)",
 )
 @click.option(
     "--output",
@@ -721,23 +800,25 @@ def validate(schema, metadata):
 )
 def export(schema, format, output, rdf_format, sql_dialect):
     """Export schema to various formats."""
-    ctx = click.get_current_context()
-    quiet = ctx.obj.get("quiet", False)
-    strict = ctx.obj.get("strict", False)
+    from .validation import SchemaValidator
+    from .export import SchemaExporter
+    from .utils import load_yaml_cached
+
+    schema = _resolve_schema_path(schema)
+    console = _get_console()
+    quiet, strict = _ctx_flags()
 
     try:
+        # Parse once; validation and the exporter both work from this content
+        schema_dict = load_yaml_cached(schema)
+
         # Validate schema
         validator = SchemaValidator(quiet=quiet, strict=strict)
-        errors = validator.validate_schema(schema)
+        errors = validator.validate_schema_dict(schema_dict, schema)
         if errors:
-            for error in errors:
-                severity = (
-                    "[red]ERROR[/red]" if error.severity == "ERROR" else "[yellow]WARNING[/yellow]"
-                )
-                console.print(f"{severity}: {error.message}")
-                if error.details:
-                    for key, value in error.details.items():
-                        console.print(f"  {key}: {value}")
+            lines = []
+            _append_validation_errors(lines, errors)
+            console.print("\n".join(lines))
             if strict:
                 sys.exit(1)
             else:
@@ -745,7 +826,7 @@ def export(schema, format, output, rdf_format, sql_dialect):
                     "[yellow]WARNING:[/yellow] Continuing with export despite validation errors"
                 )
 
-        exporter = SchemaExporter(schema)
+        exporter = SchemaExporter(schema, schema_dict=schema_dict)
         output_path = Path(output)
 
         if format == "json":
@@ -759,14 +840,14 @@ def export(schema, format, output, rdf_format, sql_dialect):
             exporter.to_csv(output_path, delimiter=delimiter)
         elif format == "sql":
             exporter.to_sql(output_path, dialect=sql_dialect)
+        elif format == "all":
+            exporter.to_all_formats(output_path, rdf_format=rdf_format)
 
         if not quiet:
-            console.print(
-                f"[green]Successfully exported schema to {format} format: {output}[/green]"
-            )
+            _print_success(f"Successfully exported schema to {format} format: {output}")
 
     except Exception as e:
-        console.print(f"[red]Error during export:[/red] {str(e)}")
+        _eprint(f"Error during export: {str(e)}")
         sys.exit(1)
 
 
@@ -800,7 +881,7 @@ def export(schema, format, output, rdf_format, sql_dialect):
 @click.option(
     "--repository",
     "-r",
-    type=click.Choice(sorted(SchemaExporter.REPOSITORY_PREFIX_FIELDS), case_sensitive=False),
+    type=click.Choice(REPOSITORY_CHOICES, case_sensitive=False),
     default=None,
     help="Prepend the target repository's required columns (e.g. tax_id, sample_alias for ENA) ahead of the ranked slot titles",
 )
@@ -811,8 +892,9 @@ def checklist_template(schema, class_name, output, format, repository):
     checklists) where each column header is the human-readable title of a
     schema slot rather than its machine-readable name.
     """
-    ctx = click.get_current_context()
-    quiet = ctx.obj.get("quiet", False)
+    from .export import SchemaExporter
+
+    quiet, _ = _ctx_flags()
 
     try:
         exporter = SchemaExporter(schema)
@@ -822,12 +904,10 @@ def checklist_template(schema, class_name, output, format, repository):
         )
 
         if not quiet:
-            console.print(
-                f"[green]Successfully wrote checklist template for '{class_name}' to {output}[/green]"
-            )
+            _print_success(f"Successfully wrote checklist template for '{class_name}' to {output}")
 
     except Exception as e:
-        console.print(f"[red]Error generating checklist template:[/red] {str(e)}")
+        _eprint(f"Error generating checklist template: {str(e)}")
         sys.exit(1)
 
 
@@ -858,13 +938,16 @@ def checklist_template(schema, class_name, output, format, repository):
 )
 def subset(schema, classes, output, no_inherited):
     """Create a subset of a LinkML schema containing specified classes."""
-    ctx = click.get_current_context()
-    quiet = ctx.obj.get("quiet", False)
-    strict = ctx.obj.get("strict", False)
+    from .core import LinkMLProcessor
+
+    quiet, strict = _ctx_flags()
 
     try:
-        # Split classes and trim whitespace
-        class_list = [c.strip() for c in classes.split(",")]
+        # Split classes, trim whitespace and drop blanks and repeats, keeping order
+        class_list = list(dict.fromkeys(c for c in map(str.strip, classes.split(",")) if c))
+        if not class_list:
+            _eprint("Error: --classes must name at least one class")
+            sys.exit(1)
 
         # Process schema with optional validation
         processor = LinkMLProcessor(schema, validate=True, strict=strict)
@@ -878,13 +961,13 @@ def subset(schema, classes, output, no_inherited):
         processor.save(subset_schema, output)
 
         if not quiet:
-            console.print(
-                f"[green]Successfully created schema subset with classes: {', '.join(class_list)}[/green]"
+            _print_success(
+                f"Successfully created schema subset with classes: {', '.join(class_list)}"
             )
-            console.print(f"[green]Saved to: {output}[/green]")
+            _print_success(f"Saved to: {output}")
 
     except Exception as e:
-        console.print(f"[red]Error creating schema subset:[/red] {str(e)}")
+        _eprint(f"Error creating schema subset: {str(e)}")
         sys.exit(1)
 
 
@@ -915,62 +998,91 @@ def subset(schema, classes, output, no_inherited):
     default="merge",
     help="How to combine schemas",
 )
-def combine(schema, additional_schemas, output, mode):
+@click.option(
+    "--no-validate",
+    is_flag=True,
+    help="Skip validation of the input schemas",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Workers used to parse and load input schemas in parallel (0 for one per CPU)",
+)
+def combine(schema, additional_schemas, output, mode, no_validate, jobs):
     """Combine multiple schemas (merge or concatenate)."""
-    ctx = click.get_current_context()
-    quiet = ctx.obj.get("quiet", False)
-    strict = ctx.obj.get("strict", False)
+    from .core import LinkMLProcessor, save_yaml
 
-    try:
-        if not additional_schemas:
+    console = _get_console()
+    quiet, strict = _ctx_flags()
+
+    if not additional_schemas:
+        _eprint(
+            "Error: --additional-schemas is required: at least two schemas are needed to combine"
+        )
+        sys.exit(1)
+
+    all_schemas = [schema] + list(additional_schemas)
+    schema_list = ",".join(str(s) for s in all_schemas)
+    combine_schemas = (
+        LinkMLProcessor.merge_multiple if mode == "merge" else LinkMLProcessor.concat_multiple
+    )
+    result, errors = _step(
+        "combining schemas",
+        combine_schemas,
+        schema_list,
+        input_type="list",
+        validate=not no_validate,
+        strict=strict,
+        return_errors=True,
+        max_workers=jobs or None,
+    )
+
+    if errors:
+        lines = []
+        for schema_path, schema_errors in errors.items():
+            lines.append(f"\n[bold red]Validation errors in schema: {schema_path}[/bold red]")
+            _append_validation_errors(lines, schema_errors)
+        console.print("\n".join(lines))
+        if strict:
+            sys.exit(1)
+        else:
             console.print(
-                "[red]Error:[/red] --additional-schemas is required: at least two schemas "
-                "are needed to combine"
+                "[yellow]WARNING:[/yellow] Continuing with schema combination despite validation errors"
             )
-            sys.exit(1)
 
-        all_schemas = [schema] + list(additional_schemas)
-        schema_list = ",".join(str(s) for s in all_schemas)
+    # The combined dict is already in memory; write it without re-loading a schema
+    _step("saving combined schema", save_yaml, result, output)
 
-        if mode == "merge":
-            result, errors = LinkMLProcessor.merge_multiple(
-                schema_list, input_type="list", validate=True, strict=strict, return_errors=True
-            )
-        else:  # concat
-            result, errors = LinkMLProcessor.concat_multiple(
-                schema_list, input_type="list", validate=True, strict=strict, return_errors=True
-            )
+    if not quiet:
+        msg = "merged" if mode == "merge" else "concatenated"
+        _print_success(f"Successfully {msg} schemas to: {output}")
 
-        if errors:
-            for schema_path, schema_errors in errors.items():
-                console.print(f"\n[bold red]Validation errors in schema: {schema_path}[/bold red]")
-                for error in schema_errors:
-                    severity = (
-                        "[red]ERROR[/red]"
-                        if error.severity == "ERROR"
-                        else "[yellow]WARNING[/yellow]"
-                    )
-                    console.print(f"{severity}: {error.message}")
-                    if error.details:
-                        for key, value in error.details.items():
-                            console.print(f"  {key}: {value}")
-            if strict:
-                sys.exit(1)
-            else:
-                console.print(
-                    "[yellow]WARNING:[/yellow] Continuing with schema combination despite validation errors"
-                )
 
-        processor = LinkMLProcessor(schema, validate=False)
-        processor.save(result, output)
+def _write_visualization(processor, config, output_path: Path, full_docs: bool) -> Path:
+    """Render the visualization or documentation bundle and return where it was written."""
+    from .visualization.core import SchemaVisualizer
 
-        if not quiet:
-            msg = "merged" if mode == "merge" else "concatenated"
-            console.print(f"[green]Successfully {msg} schemas to: {output}[/green]")
+    visualizer = SchemaVisualizer(processor, config=config)
 
-    except Exception as e:
-        console.print(f"[red]Error combining schemas:[/red] {str(e)}")
-        sys.exit(1)
+    if full_docs:
+        # Generate full documentation bundle
+        output_path.mkdir(parents=True, exist_ok=True)
+        visualizer.generate_documentation(output_path)
+        return output_path
+
+    # Generate single visualization page
+    if output_path.is_dir() or output_path.suffix == "":
+        output_path.mkdir(parents=True, exist_ok=True)
+        html_path = output_path / "schema_visualization.html"
+    else:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        html_path = output_path
+
+    visualizer.generate_visualization(output_path=html_path)
+    return html_path
 
 
 @main.command()
@@ -1007,54 +1119,39 @@ def combine(schema, additional_schemas, output, mode):
     default=True,
     help="Show or hide usage statistics",
 )
-def visualize(schema, output, full_docs, show_descriptions, show_inheritance, show_stats):
+@click.option(
+    "--validate/--no-validate",
+    default=False,
+    help="Validate the schema before generating the visualization",
+)
+def visualize(schema, output, full_docs, show_descriptions, show_inheritance, show_stats, validate):
     """Generate an interactive HTML visualization of the schema."""
-    ctx = click.get_current_context()
-    quiet = ctx.obj.get("quiet", False)
-    strict = ctx.obj.get("strict", False)
-
-    try:
-        # Initialize processor
-        processor = LinkMLProcessor(schema, validate=True, strict=strict)
-        output_path = Path(output)
-
-        # Create visualization config
-        from .visualization.core import VisualizationConfig
-
-        config = VisualizationConfig(
-            show_descriptions=show_descriptions,
-            show_inheritance=show_inheritance,
-        )
+    from .core import LinkMLProcessor
+    from .visualization.core import VisualizationConfig
+
+    quiet, strict = _ctx_flags()
+    what = "generating schema visualization"
+
+    # Initialize processor; rendering only needs the parsed schema
+    processor = _step(what, LinkMLProcessor, schema, validate=validate, strict=strict)
+    if processor.errors:
+        lines = []
+        _append_validation_errors(lines, processor.errors)
+        _get_console().print("\n".join(lines))
+        if strict:
+            sys.exit(1)
 
-        # Initialize visualizer
-        visualizer = SchemaVisualizer(processor, config=config)
+    config = VisualizationConfig(
+        show_descriptions=show_descriptions,
+        show_inheritance=show_inheritance,
+    )
+    written = _step(what, _write_visualization, processor, config, Path(output), full_docs)
 
+    if not quiet:
         if full_docs:
-            # Generate full documentation bundle
-            output_path.mkdir(parents=True, exist_ok=True)
-            visualizer.generate_documentation(output_path)
-            if not quiet:
-                console.print(
-                    f"[green]Successfully generated documentation bundle in: {output_path}[/green]"
-                )
+            _print_success(f"Successfully generated documentation bundle in: {written}")
         else:
-            # Generate single visualization page
-            if output_path.is_dir() or output_path.suffix == "":
-                output_path.mkdir(parents=True, exist_ok=True)
-                html_path = output_path / "schema_visualization.html"
-            else:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                html_path = output_path
-
-            visualizer.generate_visualization(output_path=html_path)
-            if not quiet:
-                console.print(
-                    f"[green]Successfully generated schema visualization in: {html_path}[/green]"
-                )
-
-    except Exception as e:
-        console.print(f"[red]Error generating schema visualization:[/red] {str(e)}")
-        sys.exit(1)
+            _print_success(f"Successfully generated schema visualization in: {written}")
 
 
 if __name__ == "__main__":
@@ -2,31 +2,289 @@
 """Core functionality for the LinkML Toolkit."""
 
 from pathlib import Path
-from typing import Dict, List, Union, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Union, Optional, Any, Tuple
 import logging
+import os
 import yaml
 import sys
+import dataclasses
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict, deque
 from linkml_runtime.utils.schemaview import SchemaView
-from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.linkml_model import SchemaDefinition, SlotDefinition
 
 from .validation import SchemaValidator
-from .utils import load_yaml, save_yaml
-from rich.console import Console
-from rich.text import Text
+from .utils import clear_schema_cache, load_yaml, load_yaml_cached, save_yaml
 
 # Logging configuration
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", stream=sys.stdout)
 logger = logging.getLogger(__name__)
 
-console = Console()
+
+@functools.lru_cache(maxsize=4)
+def _get_validator(quiet: bool, strict: bool) -> SchemaValidator:
+    """Return a shared validator; it holds only its settings, so processors can share it."""
+    return SchemaValidator(quiet=quiet, strict=strict)
+
+
+def _warm_schema_cache(schema_path: Path) -> None:
+    """Parse a schema in a worker process so the parent hits the JSON cache."""
+    try:
+        load_yaml_cached(schema_path)
+    except Exception as e:
+        # The parent reports the failure when it loads the schema itself
+        logger.debug(f"Pre-parse failed for {schema_path}: {e}")
+
+
+def _preparse_schemas(paths: List[Path], max_workers: Optional[int]) -> None:
+    """
+    Parse schema files in parallel ahead of loading them one by one.
+
+    YAML parsing is CPU-bound, so the files are parsed in separate processes.
+    The parsed content is handed back through the on-disk JSON cache rather
+    than pickled, and nothing is done for a single worker.
+
+    Args:
+        paths (List[Path]): Schema files to parse
+        max_workers (Optional[int]): Number of worker processes (None for CPU count)
+    """
+    if max_workers == 1 or len(paths) < 2:
+        return
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_warm_schema_cache, paths))
+    except Exception as e:
+        logger.debug(f"Parallel schema pre-parse unavailable: {e}")
+
+
+class SchemaInternPool:
+    """
+    Share structurally equal sub-trees between parsed schemas.
+
+    Schemas combined together often repeat the same fragments (e.g. a common
+    ``types`` block). Canonicalizing them through one pool makes those
+    fragments the same object, so merging can skip them with an identity
+    check and they are only held in memory once; strings are interned for the
+    same reason. Canonical nodes are keyed bottom-up by their items and the
+    ids of their already-canonical children, so each node is visited once.
+    The pool keeps its nodes alive and is meant to live for a single merge or
+    concatenation.
+    """
+
+    def __init__(self):
+        self._nodes: Dict[Tuple, Any] = {}
+
+    def canonicalize(self, obj: Any) -> Any:
+        """
+        Return a canonical instance of a parsed YAML value.
+
+        Args:
+            obj (Any): Dict, list or scalar from a parsed schema
+
+        Returns:
+            Any: The shared instance for containers and strings, the value itself
+                for other scalars
+        """
+        if isinstance(obj, dict):
+            items = [(self.canonicalize(k), self.canonicalize(v)) for k, v in obj.items()]
+            key = ("dict",) + tuple((k, self._token(v)) for k, v in items)
+            factory = lambda: dict(items)
+        elif isinstance(obj, list):
+            items = [self.canonicalize(v) for v in obj]
+            key = ("list",) + tuple(self._token(v) for v in items)
+            factory = lambda: items
+        elif type(obj) is str:
+            # Names and ranges such as "string" repeat throughout schemas
+            return sys.intern(obj)
+        else:
+            return obj
+
+        try:
+            node = self._nodes.get(key)
+        except TypeError:
+            # Unhashable scalar somewhere in the node; keep it unshared
+            return factory()
+        if node is None:
+            node = self._nodes[key] = factory()
+        return node
+
+    @staticmethod
+    def _token(value: Any) -> Tuple:
+        if isinstance(value, (dict, list)):
+            return ("id", id(value))
+        return (type(value).__name__, value)
+
+
+# Sections of a schema holding named elements, in analysis order
+_ANALYSIS_SECTIONS = ("classes", "slots", "enums", "types", "subsets")
+_ELEMENT_SECTIONS = frozenset(_ANALYSIS_SECTIONS)
+
+# Public data attributes of a slot definition, in dir() order: the dataclass
+# fields plus class-level metadata such as class_class_uri
+_SLOT_ATTRS = tuple(
+    sorted(
+        {field.name for field in dataclasses.fields(SlotDefinition)}
+        | {
+            attr
+            for attr in dir(SlotDefinition)
+            if not attr.startswith("_") and not callable(getattr(SlotDefinition, attr))
+        }
+    )
+)
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _safe_convert(obj: Any) -> Any:
+    """Safely convert any object to a JSON-serializable format."""
+    # Exact-type checks first: plain values make up nearly all of a slot's attributes
+    obj_type = type(obj)
+    if obj is None or obj_type in _SCALAR_TYPES:
+        return obj
+    if obj_type is list or obj_type is tuple:
+        return [_safe_convert(x) for x in obj]
+    if obj_type is dict:
+        return {str(k): _safe_convert(v) for k, v in obj.items()}
+
+    # Subclasses (e.g. URIRef) and LinkML objects
+    if isinstance(obj, _SCALAR_TYPES):
+        return obj
+    elif isinstance(obj, (list, tuple)):
+        return [_safe_convert(x) for x in obj]
+    elif isinstance(obj, dict):
+        return {str(k): _safe_convert(v) for k, v in obj.items()}
+    elif hasattr(obj, "to_dict"):
+        return _safe_convert(obj.to_dict())
+    elif hasattr(obj, "__dict__"):
+        return {k: _safe_convert(v) for k, v in obj.__dict__.items() if not k.startswith("_")}
+    else:
+        return str(obj)
+
+
+# (attribute, default factory) pairs reported for each element in a summary analysis;
+# factories give every entry its own empty list or dict
+_CLASS_SUMMARY_FIELDS = (
+    ("description", str),
+    ("abstract", bool),
+    ("slots", list),
+    ("is_a", str),
+    ("mixins", list),
+)
+_SLOT_SUMMARY_FIELDS = (
+    ("description", str),
+    ("range", str),
+    ("required", bool),
+    ("multivalued", bool),
+    ("domain", str),
+)
+_ENUM_SUMMARY_FIELDS = (
+    ("description", str),
+    ("permissible_values", dict),
+)
+_TYPE_SUMMARY_FIELDS = (
+    ("description", str),
+    ("typeof", str),
+)
+
+_MISSING = object()
+
+
+def _summarize(name: str, element: Any, fields: Tuple[Tuple[str, Callable[[], Any]], ...]) -> Dict:
+    """Build a summary entry from an element's attributes."""
+    try:
+        # LinkML definitions are dataclasses; read their fields straight from __dict__
+        values = vars(element)
+    except TypeError:
+        values = {attr: getattr(element, attr) for attr, _ in fields if hasattr(element, attr)}
+
+    summary = {"name": name}
+    for attr, default in fields:
+        value = values.get(attr, _MISSING)
+        summary[attr] = default() if value is _MISSING else value
+    return summary
+
+
+# Marks description lines added by subsetting, so re-subsetting replaces them
+_SUBSET_MARKER = "subset of the original schema"
+
+
+def _apply_subset_description(subsetted: Dict, class_names: List[str]) -> None:
+    """Replace any subset note in a schema description with one naming class_names."""
+    if "description" not in subsetted:
+        return
+
+    desc = subsetted["description"]
+    if not isinstance(desc, str):
+        desc = str(desc)
+
+    # Remove any existing lines about being a subset
+    desc_lines = [line for line in desc.split("\n") if _SUBSET_MARKER not in line]
+
+    # Add new subset description line
+    subset_line = (
+        f"This is a {_SUBSET_MARKER} containing the following classes: "
+        f"{', '.join(sorted(class_names))}."
+    )
+
+    # Ensure no duplicates are added
+    if subset_line not in desc_lines:
+        if not desc.endswith("\n"):
+            desc_lines.append("")
+        desc_lines.append(subset_line)
+
+    subsetted["description"] = "\n".join(desc_lines).strip()
+
+
+def _write_lines(output_path: Union[str, Path], lines: Iterable[str]) -> None:
+    """
+    Write newline-separated lines to a file without joining them in memory.
+
+    Lines go to a temporary file next to output_path that replaces it only once
+    every line has been produced, so an error while generating them leaves no
+    partial output (and any existing file untouched).
+    """
+    output_path = Path(output_path)
+
+    # Ensure parent directory exists
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            separator = ""
+            for line in lines:
+                f.write(separator)
+                f.write(line)
+                separator = "\n"
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
 
 
 class LinkMLProcessor:
     """Process LinkML schemas with support for non-standard fields."""
 
+    # combine keeps one processor per input schema alive; avoid a __dict__ each
+    __slots__ = (
+        "schema_path",
+        "quiet",
+        "strict",
+        "validator",
+        "errors",
+        "schema_dict",
+        "schema",
+        "_schema_view",
+        "_analysis_cache",
+        "_usage_index",
+        "_structure",
+    )
+
     def __init__(
         self,
         schema_path: Union[str, Path],
@@ -46,34 +304,45 @@ class LinkMLProcessor:
         self.schema_path = Path(schema_path)
         self.quiet = quiet
         self.strict = strict
-        self.validator = SchemaValidator(quiet=quiet, strict=strict)
+        self.validator = _get_validator(quiet, strict)
         self.errors = []
+        self._analysis_cache: Dict[Tuple, Dict] = {}
+        self._usage_index: Optional[Dict[str, List[Tuple[str, Dict]]]] = None
+        self._structure: Optional[Tuple[Dict, Dict]] = None
 
-        # Load raw schema first
-        self.schema_dict = self._load_schema()
+        # Load raw schema first; validation checks the same parsed content
+        self.schema_dict = self._load_schema(validate=validate)
 
         # Create SchemaDefinition
         self.schema = self._create_schema_definition(self.schema_dict)
 
-        if validate:
-            self.errors = self.validator.validate_schema(self.schema_path)
-
-        # Initialize SchemaView
-        self.schema_view = SchemaView(self.schema)
+        # SchemaView is built on first use; merging and concatenation never need it
+        self._schema_view: Optional[SchemaView] = None
 
         if not quiet:
             logger.info(f"Loaded schema from {self.schema_path}")
 
-    def _load_schema(self) -> Dict:
+    @property
+    def schema_view(self) -> SchemaView:
+        """SchemaView over the loaded schema, created on first access."""
+        if self._schema_view is None:
+            self._schema_view = SchemaView(self.schema)
+        return self._schema_view
+
+    def _load_schema(self, validate: bool = False) -> Dict:
         """
         Load the LinkML schema from file.
 
+        Args:
+            validate (bool): Validate the parsed content, storing results in self.errors
+
         Returns:
             Dict: Loaded schema dictionary
         """
         try:
-            with open(self.schema_path) as f:
-                schema_dict = yaml.safe_load(f)
+            schema_dict = load_yaml_cached(self.schema_path)
+            if validate:
+                self.errors = self.validator.validate_schema_dict(schema_dict, self.schema_path)
 
             # Validate basic schema structure
             if not isinstance(schema_dict, dict):
@@ -92,6 +361,9 @@ class LinkMLProcessor:
 
         except Exception as e:
             logger.warning(f"Failed to load schema {self.schema_path}: {e}")
+            if validate and not self.errors:
+                # Let the validator report why the file could not be read
+                self.errors = self.validator.validate_schema(self.schema_path)
             return {}
 
     def _create_schema_definition(self, schema_dict: Dict) -> SchemaDefinition:
@@ -175,11 +447,21 @@ class LinkMLProcessor:
             detailed: Whether to provide detailed analysis. Defaults to False.
 
         Returns:
-            Dict: Analysis results of the schema
+            Dict: Analysis results of the schema. Results are memoized per
+                schema and arguments, so callers should not modify them.
         """
         if sections is None:
-            sections = ["classes", "slots", "enums", "types", "subsets"]
+            sections = _ANALYSIS_SECTIONS
 
+        cache_key = (id(self.schema), tuple(sections), detailed)
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        results = self._analysis_cache[cache_key] = self._build_analysis(sections, detailed)
+        return results
+
+    def _build_analysis(self, sections: List[str], detailed: bool) -> Dict:
+        """Build the analysis returned by analyze_schema."""
         # Basic metadata with safe attribute access
         results = {
             "name": getattr(self.schema, "name", ""),
@@ -206,116 +488,97 @@ class LinkMLProcessor:
         results["prefixes"] = prefixes
 
         # Analyze requested sections
+        analyzers = {
+            "classes": self._analyze_classes,
+            "slots": self._analyze_slots,
+            "enums": self._analyze_enums,
+            "types": self._analyze_types,
+            "subsets": self._analyze_subsets,
+        }
         for section in sections:
-            if section == "classes":
-                results[section] = self._analyze_classes(detailed)
-            elif section == "slots":
-                results[section] = self._analyze_slots(detailed)
-            elif section == "enums":
-                results[section] = self._analyze_enums(detailed)
-            elif section == "types":
-                results[section] = self._analyze_types(detailed)
-            elif section == "subsets":
-                results[section] = self._analyze_subsets(detailed)
+            analyzer = analyzers.get(section)
+            if analyzer is not None:
+                results[section] = analyzer(detailed)
 
         return results
 
-    def _analyze_classes(self, detailed: bool = False) -> Dict:
-        """Analyze classes in the schema."""
-        classes = {}
-        for class_name in self.schema_view.all_classes():
+    def _analyze_elements(self, kind: str, elements: Dict, describe) -> Dict:
+        """
+        Describe every element of one schema section.
+
+        Args:
+            kind (str): Element kind used in warnings, e.g. "class"
+            elements (Dict): Element definitions keyed by name
+            describe: Callable taking (name, definition), returning a dict or None to skip
+
+        Returns:
+            Dict: Descriptions keyed by element name
+        """
+        try:
+            results = {}
+            for name, element in elements.items():
+                info = describe(name, element)
+                if info:
+                    results[name] = info
+            return results
+        except Exception:
+            # Failures are rare; only then pay for per-element error handling so
+            # one broken definition does not hide the rest of the section
+            pass
+
+        results = {}
+        for name, element in elements.items():
             try:
-                class_def = self.schema_view.get_class(class_name)
-                if detailed:
-                    class_info = self.analyze_class(class_name)
-                    if class_info:
-                        classes[class_name] = class_info
-                else:
-                    # Provide minimal info instead of just True
-                    classes[class_name] = {
-                        "name": class_name,
-                        "description": getattr(class_def, "description", ""),
-                        "abstract": getattr(class_def, "abstract", False),
-                        "slots": getattr(class_def, "slots", []),
-                        "is_a": getattr(class_def, "is_a", ""),
-                        "mixins": getattr(class_def, "mixins", []),
-                    }
+                info = describe(name, element)
             except Exception as e:
-                logger.warning(f"Error analyzing class {class_name}: {str(e)}")
-                classes[class_name] = {"name": class_name, "description": "Error analyzing class"}
-        return classes
+                logger.warning(f"Error analyzing {kind} {name}: {str(e)}")
+                results[name] = {"name": name, "description": f"Error analyzing {kind}"}
+                continue
+            if info:
+                results[name] = info
+        return results
+
+    def _analyze_classes(self, detailed: bool = False) -> Dict:
+        """Analyze classes in the schema."""
+        if detailed:
+            describe = lambda name, _: self.analyze_class(name)
+        else:
+            # Provide minimal info instead of just True
+            describe = lambda name, element: _summarize(name, element, _CLASS_SUMMARY_FIELDS)
+        return self._analyze_elements("class", self.schema_view.all_classes(), describe)
 
     def _analyze_slots(self, detailed: bool = False) -> Dict:
         """Analyze slots in the schema."""
-        slots = {}
-        for slot_name in self.schema_view.all_slots():
-            try:
-                slot_def = self.schema_view.get_slot(slot_name)
-                if detailed:
-                    slot_info = self.analyze_slot(slot_name)
-                    if slot_info:
-                        slots[slot_name] = slot_info
-                else:
-                    # Provide minimal info instead of just True
-                    slots[slot_name] = {
-                        "name": slot_name,
-                        "description": getattr(slot_def, "description", ""),
-                        "range": getattr(slot_def, "range", ""),
-                        "required": getattr(slot_def, "required", False),
-                        "multivalued": getattr(slot_def, "multivalued", False),
-                        "domain": getattr(slot_def, "domain", ""),
-                    }
-            except Exception as e:
-                logger.warning(f"Error analyzing slot {slot_name}: {str(e)}")
-                slots[slot_name] = {"name": slot_name, "description": "Error analyzing slot"}
-        return slots
+        if detailed:
+            describe = lambda name, _: self.analyze_slot(name)
+        else:
+            # Provide minimal info instead of just True
+            get_slot = self.schema_view.get_slot
+            describe = lambda name, _: _summarize(name, get_slot(name), _SLOT_SUMMARY_FIELDS)
+        return self._analyze_elements("slot", self.schema_view.all_slots(), describe)
 
     def _analyze_enums(self, detailed: bool = False) -> Dict:
         """Analyze enums in the schema."""
-        enums = {}
-        for enum_name in self.schema_view.all_enums():
-            try:
-                enum_def = self.schema_view.get_enum(enum_name)
-                if detailed:
-                    enum_info = self.analyze_enum(enum_name)
-                    if enum_info:
-                        enums[enum_name] = enum_info
-                else:
-                    # Provide minimal info instead of just True
-                    enums[enum_name] = {
-                        "name": enum_name,
-                        "description": getattr(enum_def, "description", ""),
-                        "permissible_values": getattr(enum_def, "permissible_values", {}),
-                    }
-            except Exception as e:
-                logger.warning(f"Error analyzing enum {enum_name}: {str(e)}")
-                enums[enum_name] = {"name": enum_name, "description": "Error analyzing enum"}
-        return enums
+        if detailed:
+            describe = lambda name, _: self.analyze_enum(name)
+        else:
+            # Provide minimal info instead of just True
+            describe = lambda name, element: _summarize(name, element, _ENUM_SUMMARY_FIELDS)
+        return self._analyze_elements("enum", self.schema_view.all_enums(), describe)
 
     def _analyze_types(self, detailed: bool = False) -> Dict:
         """Analyze types in the schema."""
-        types = {}
-        for type_name in self.schema_view.all_types():
-            try:
-                type_def = self.schema_view.get_type(type_name)
-                if detailed:
-                    types[type_name] = {
-                        "name": type_name,
-                        "description": getattr(type_def, "description", ""),
-                        "typeof": getattr(type_def, "typeof", ""),
-                        "uri": getattr(type_def, "uri", ""),
-                    }
-                else:
-                    # Provide minimal info instead of just True
-                    types[type_name] = {
-                        "name": type_name,
-                        "description": getattr(type_def, "description", ""),
-                        "typeof": getattr(type_def, "typeof", ""),
-                    }
-            except Exception as e:
-                logger.warning(f"Error analyzing type {type_name}: {str(e)}")
-                types[type_name] = {"name": type_name, "description": "Error analyzing type"}
-        return types
+        if detailed:
+            describe = lambda name, element: {
+                "name": name,
+                "description": getattr(element, "description", ""),
+                "typeof": getattr(element, "typeof", ""),
+                "uri": getattr(element, "uri", ""),
+            }
+        else:
+            # Provide minimal info instead of just True
+            describe = lambda name, element: _summarize(name, element, _TYPE_SUMMARY_FIELDS)
+        return self._analyze_elements("type", self.schema_view.all_types(), describe)
 
     def _analyze_subsets(self, detailed: bool = False) -> Dict:
         """Analyze subsets in the schema."""
@@ -324,11 +587,11 @@ class LinkMLProcessor:
 
         try:
             if isinstance(raw_subsets, dict):
-                for name, subset in raw_subsets.items():
-                    if detailed:
+                if detailed:
+                    for name, subset in raw_subsets.items():
                         subsets[name] = self._convert_to_dict(subset)
-                    else:
-                        subsets[name] = True
+                else:
+                    subsets = dict.fromkeys(raw_subsets, True)
             elif isinstance(raw_subsets, (list, tuple)):
                 for subset in raw_subsets:
                     subset_dict = self._convert_to_dict(subset)
@@ -400,79 +663,70 @@ class LinkMLProcessor:
         if not slot_def:
             return None
 
-        def safe_convert(obj):
-            """Safely convert any object to a JSON-serializable format."""
-            if obj is None:
-                return None
-            elif isinstance(obj, (str, int, float, bool)):
-                return obj
-            elif isinstance(obj, (list, tuple)):
-                return [safe_convert(x) for x in obj]
-            elif isinstance(obj, dict):
-                return {str(k): safe_convert(v) for k, v in obj.items()}
-            elif hasattr(obj, "to_dict"):
-                return safe_convert(obj.to_dict())
-            elif hasattr(obj, "__dict__"):
-                return {
-                    k: safe_convert(v) for k, v in obj.__dict__.items() if not k.startswith("_")
-                }
-            else:
-                return str(obj)
+        # Inducing class slots fills in derived fields such as domain_of on
+        # SchemaView's slot definitions, so index usage before reading them
+        usage = {}
+        try:
+            for class_name, class_info in self._slot_usage_index().get(slot_name, ()):
+                usage[class_name] = dict(class_info)
+        except Exception as e:
+            logger.debug(f"Error analyzing slot usage: {str(e)}")
 
-        # Get all attributes dynamically
+        # Get all public data attributes
         analysis = {}
-        for attr in dir(slot_def):
-            if not attr.startswith("_"):  # Skip private attributes
-                try:
-                    value = getattr(slot_def, attr)
-                    if callable(value):  # Skip methods
-                        continue
-                    analysis[attr] = safe_convert(value)
-                except Exception as e:
-                    logger.debug(f"Error converting attribute {attr}: {str(e)}")
+        for attr in _SLOT_ATTRS:
+            try:
+                analysis[attr] = _safe_convert(getattr(slot_def, attr, None))
+            except Exception as e:
+                logger.debug(f"Error converting attribute {attr}: {str(e)}")
 
         # Add usage information
-        usage = {}
-        try:
-            for class_name in self.schema_view.all_classes():
-                class_def = self.schema_view.get_class(class_name)
-                if not class_def:
-                    continue
+        analysis["usage"] = usage
+        return analysis
 
-                class_slots = getattr(class_def, "slots", []) or []
-                inherited_slots = self.schema_view.class_induced_slots(class_name)
+    def _slot_usage_index(self) -> Dict[str, List[Tuple[str, Dict]]]:
+        """
+        Map each slot to the classes using it, built in one pass over the classes.
 
-                if slot_name in class_slots or slot_name in inherited_slots:
-                    is_direct = slot_name in class_slots
-                    class_info = {
-                        "own": is_direct,
-                        "inherited": not is_direct,
-                    }
+        Returns:
+            Dict[str, List[Tuple[str, Dict]]]: (class name, usage info) pairs per
+                slot, in class order
+        """
+        if self._usage_index is not None:
+            return self._usage_index
 
-                    # Add slot usage if present
-                    if hasattr(class_def, "slot_usage"):
-                        slot_usage = getattr(class_def, "slot_usage", {}).get(slot_name)
-                        if slot_usage:
-                            # Extract specific keys from slot_usage
-                            overrides = slot_usage.get("overrides")
-                            required = slot_usage.get("required")
-                            multivalued = slot_usage.get("multivalued")
-
-                            # Add extracted information to class_info
-                            if overrides is not None:
-                                class_info["overrides"] = overrides
-                            if required is not None:
-                                class_info["required"] = required
-                            if multivalued is not None:
-                                class_info["multivalued"] = multivalued
-
-                    usage[class_name] = class_info
+        index = {}
+        for class_name, class_def in self.schema_view.all_classes().items():
+            if not class_def:
+                continue
+
+            own_slots = set(class_def.slots or [])
+            own_slots.update(class_def.attributes or {})
+            slot_usage = class_def.slot_usage or {}
+
+            for induced_slot in self.schema_view.class_induced_slots(class_name):
+                slot_name = induced_slot.name
+                is_direct = slot_name in own_slots
+                class_info = {
+                    "own": is_direct,
+                    "inherited": not is_direct,
+                }
 
-        except Exception as e:
-            logger.debug(f"Error analyzing slot usage: {str(e)}")
+                # Add slot usage overrides if present
+                overrides = slot_usage.get(slot_name)
+                if overrides:
+                    for key in ("overrides", "required", "multivalued"):
+                        if isinstance(overrides, dict):
+                            value = overrides.get(key)
+                        else:
+                            value = getattr(overrides, key, None)
+                        if value is not None:
+                            class_info[key] = value
 
-        analysis["usage"] = usage
-        return analysis
+                index.setdefault(slot_name, []).append((class_name, class_info))
+
+        self._usage_index = index
+        return index
 
     def analyze_enum(self, enum_name: str) -> Optional[Dict]:
         """
@@ -506,8 +760,7 @@ class LinkMLProcessor:
         """
         usage = {}
         try:
-            for class_name in self.schema_view.all_classes():
-                class_def = self.schema_view.get_class(class_name)
+            for class_name, class_def in self.schema_view.all_classes().items():
                 class_slots = self.schema_view.class_slots(class_name)
 
                 if not class_slots:
@@ -550,6 +803,11 @@ class LinkMLProcessor:
         if not self.quiet:
             logger.info(f"Saved schema to {output_path}")
 
+    @classmethod
+    def clear_schema_cache(cls) -> None:
+        """Forget schemas parsed earlier in this process so the next load re-reads them."""
+        clear_schema_cache()
+
     @classmethod
     def _load_schema_list(cls, schema_list: str, input_type: str = "auto") -> List[Path]:
         """
@@ -585,13 +843,9 @@ class LinkMLProcessor:
                 if not list_path.is_file():
                     raise FileNotFoundError(f"Schema list file not found: {schema_list}")
 
-                # Read paths from file
-                with open(list_path) as f:
-                    paths = [
-                        Path(line.strip())
-                        for line in f
-                        if line.strip() and not line.startswith("#")
-                    ]
+                # Read paths from file in one read, skipping blank and comment lines
+                entries = (line.strip() for line in list_path.read_text().splitlines())
+                paths = [Path(entry) for entry in entries if entry and not entry.startswith("#")]
 
                 # Validate paths were found
                 if not paths:
@@ -618,6 +872,59 @@ class LinkMLProcessor:
             logger.error(f"Unexpected error loading schema list: {e}")
             raise ValueError(f"Failed to load schema list: {e}")
 
+    @classmethod
+    def _load_processors(
+        cls,
+        paths: List[Path],
+        validate: bool,
+        strict: bool,
+        max_workers: Optional[int] = 1,
+    ) -> Tuple[List["LinkMLProcessor"], Dict[str, List]]:
+        """
+        Load a processor for each schema path, skipping empty schemas.
+
+        With more than one worker the schemas are loaded in a thread pool so
+        file reads and parsing overlap; results keep the order of ``paths``.
+
+        Args:
+            paths (List[Path]): Schema files to load
+            validate (bool): Validate each schema while loading
+            strict (bool): Re-raise the first load failure
+            max_workers (Optional[int]): Number of worker threads (None for default)
+
+        Returns:
+            Tuple[List[LinkMLProcessor], Dict[str, List]]: Loaded processors and
+                validation errors keyed by schema path
+        """
+
+        def load(path: Path):
+            try:
+                return cls(path, validate=validate, strict=strict), None
+            except Exception as e:
+                return None, e
+
+        if max_workers == 1 or len(paths) < 2:
+            outcomes = [load(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(load, paths))
+
+        processors = []
+        errors = {}
+        for path, (processor, error) in zip(paths, outcomes):
+            if error is not None:
+                logger.error(f"Failed to process schema {path}: {error}")
+                if strict:
+                    raise error
+                continue
+            if processor.schema_dict:
+                processors.append(processor)
+            else:
+                logger.warning(f"Skipping empty schema: {path}")
+            if processor.errors:
+                errors[str(path)] = processor.errors
+        return processors, errors
+
     @classmethod
     def merge_multiple(
         cls,
@@ -626,6 +933,7 @@ class LinkMLProcessor:
         validate: bool = True,
         strict: bool = False,
         return_errors: bool = True,
+        max_workers: Optional[int] = 1,
     ) -> Dict:
         """
         Merge multiple schemas while preserving structure of the first schema.
@@ -633,8 +941,10 @@ class LinkMLProcessor:
         Args:
             schema_list: List of schema paths or file containing schema paths
             input_type: Method of interpreting input
-            validate: Whether to validate schemas during processing
+            validate: Whether to validate schemas during processing (skipped when
+                return_errors is False, as the results would be discarded)
             strict: Enable strict error handling
+            max_workers: Workers used to parse and load schemas (None for CPU count)
 
         Returns:
             Dict containing merged schema maintaining original structure
@@ -644,62 +954,61 @@ class LinkMLProcessor:
 
         if len(paths) < 2:
             raise ValueError("At least two schemas are required for merging")
+        _preparse_schemas(paths, max_workers)
         # Process and merge schemas
-        processed_schemas = []
-        errors = {}
-        for path in paths:
-            try:
-                processor = cls(path, validate=validate, strict=strict)
-                if processor.schema_dict:
-                    processed_schemas.append(processor)
-                else:
-                    logger.warning(f"Skipping empty schema: {path}")
-                if processor.errors:
-                    errors[str(path)] = processor.errors
-            except Exception as e:
-                logger.error(f"Failed to process schema {path}: {e}")
-                if strict:
-                    raise
+        # Validation results are only reported when errors are returned
+        processed_schemas, errors = cls._load_processors(
+            paths, validate and return_errors, strict, max_workers
+        )
 
         if len(processed_schemas) < 2:
             raise ValueError("Not enough valid schemas to merge")
 
+        # Share fragments repeated across schemas
+        intern_pool = SchemaInternPool()
+        for processor in processed_schemas:
+            processor.schema_dict = intern_pool.canonicalize(processor.schema_dict)
+
         # Use first schema as base and analyze its structure
         base_processor = processed_schemas[0]
         base_structure = base_processor.analyze_schema_structure()
 
         # Start with a deep copy of the base schema
-        merged = OrderedDict()
+        merged = {}
 
         # Copy all sections following original order
         for section in base_structure["order"]:
             if section in base_processor.schema_dict:
-                if section not in ["classes", "slots", "types", "enums", "subsets"]:
+                if section not in _ELEMENT_SECTIONS:
                     # Copy metadata sections exactly
                     value = base_processor.schema_dict[section]
                     if isinstance(value, dict):
-                        merged[section] = OrderedDict(value)
+                        merged[section] = dict(value)
                     else:
                         merged[section] = value
                 else:
                     # Initialize mergeable sections
-                    merged[section] = OrderedDict()
+                    merged[section] = {}
                     if section in base_processor.schema_dict:
                         merged[section].update(base_processor.schema_dict[section])
 
+        # Unique items of list metadata sections, in first-seen order
+        list_sections = {}
+
         # Merge content from other schemas
         for other_processor in processed_schemas[1:]:
             # Handle metadata fields - only merge lists/dicts
             for section in base_structure["order"]:
-                if section not in ["classes", "slots", "types", "enums", "subsets"]:
+                if section not in _ELEMENT_SECTIONS:
                     if section in other_processor.schema_dict:
                         if isinstance(merged.get(section), list) and isinstance(
                             other_processor.schema_dict[section], list
                         ):
                             # Merge lists uniquely
-                            merged[section] = list(
-                                set(merged[section] + other_processor.schema_dict[section])
-                            )
+                            seen = list_sections.get(section)
+                            if seen is None:
+                                seen = list_sections[section] = dict.fromkeys(merged[section])
+                            seen.update(dict.fromkeys(other_processor.schema_dict[section]))
                         elif isinstance(merged.get(section), dict) and isinstance(
                             other_processor.schema_dict[section], dict
                         ):
@@ -709,15 +1018,22 @@ class LinkMLProcessor:
             # Merge main sections
             for section in ["classes", "slots", "types", "enums"]:
                 if section in other_processor.schema_dict:
-                    # Add new items from other schema
-                    for key, value in other_processor.schema_dict[section].items():
-                        if key in merged[section]:
-                            # Merge existing items
-                            if isinstance(value, dict) and isinstance(merged[section][key], dict):
-                                merged[section][key].update(value)
-                        else:
-                            # Add new items
-                            merged[section][key] = value
+                    target = merged[section]
+                    incoming = other_processor.schema_dict[section]
+
+                    # Merge items both schemas define without mutating shared fragments;
+                    # fragments shared with an earlier schema are skipped
+                    for key in incoming.keys() & target.keys():
+                        value = incoming[key]
+                        existing = target[key]
+                        if value is not existing and isinstance(value, dict):
+                            if isinstance(existing, dict):
+                                target[key] = {**existing, **value}
+
+                    # Add new items in the other schema's order
+                    target.update(
+                        {key: value for key, value in incoming.items() if key not in target}
+                    )
 
             # Handle subsets specially - preserve empty subset structure
             if "subsets" in other_processor.schema_dict:
@@ -727,6 +1043,9 @@ class LinkMLProcessor:
                         empty_format = base_structure["empty_values"].get("subsets", {}).get(key)
                         merged["subsets"][key] = empty_format
 
+        for section, seen in list_sections.items():
+            merged[section] = list(seen)
+
         if return_errors:
             return merged, errors
         return merged
@@ -739,6 +1058,7 @@ class LinkMLProcessor:
         validate: bool = True,
         strict: bool = False,
         return_errors: bool = True,
+        max_workers: Optional[int] = 1,
     ) -> Union[Dict, Tuple[Dict, Dict]]:
         """
         Concatenate multiple schemas while preserving structure of the first schema.
@@ -746,9 +1066,11 @@ class LinkMLProcessor:
         Args:
             schema_list: List of schema paths or file containing schema paths
             input_type: Method of interpreting input
-            validate: Whether to validate schemas during processing
+            validate: Whether to validate schemas during processing (skipped when
+                return_errors is False, as the results would be discarded)
             strict: Enable strict error handling
             return_errors: Whether to return validation errors along with the schema
+            max_workers: Workers used to parse and load schemas (None for CPU count)
 
         Returns:
             If return_errors=False:
@@ -761,50 +1083,48 @@ class LinkMLProcessor:
 
         if len(paths) < 2:
             raise ValueError("At least two schemas are required for concatenation")
+        _preparse_schemas(paths, max_workers)
 
         # Process schemas
-        processed_schemas = []
-        errors = {}
-        for path in paths:
-            try:
-                processor = cls(path, validate=validate, strict=strict)
-                if processor.schema_dict:
-                    processed_schemas.append(processor)
-                else:
-                    logger.warning(f"Skipping empty schema: {path}")
-                if processor.errors:
-                    errors[str(path)] = processor.errors
-            except Exception as e:
-                logger.error(f"Failed to process schema {path}: {e}")
-                if strict:
-                    raise
+        # Validation results are only reported when errors are returned
+        processed_schemas, errors = cls._load_processors(
+            paths, validate and return_errors, strict, max_workers
+        )
 
         if len(processed_schemas) < 2:
             raise ValueError("Not enough valid schemas to concatenate")
 
+        # Share fragments repeated across schemas
+        intern_pool = SchemaInternPool()
+        for processor in processed_schemas:
+            processor.schema_dict = intern_pool.canonicalize(processor.schema_dict)
+
         # Use first schema as base and analyze its structure
         base_processor = processed_schemas[0]
         base_structure = base_processor.analyze_schema_structure()
 
         # Start with base schema structure
-        concatenated = OrderedDict()
+        concatenated = {}
 
         # Copy all sections following original order
         for section in base_structure["order"]:
             if section in base_processor.schema_dict:
-                if section not in ["classes", "slots", "types", "enums", "subsets"]:
+                if section not in _ELEMENT_SECTIONS:
                     # Copy metadata sections exactly
                     value = base_processor.schema_dict[section]
                     if isinstance(value, dict):
-                        concatenated[section] = OrderedDict(value)
+                        concatenated[section] = dict(value)
                     else:
                         concatenated[section] = value
                 else:
                     # Initialize concatenable sections
-                    concatenated[section] = OrderedDict()
+                    concatenated[section] = {}
                     if section in base_processor.schema_dict:
                         concatenated[section].update(base_processor.schema_dict[section])
 
+        # Use the same empty value format as the base schema for subsets
+        subset_formats = base_structure["empty_values"].get("subsets", {})
+
         # Process remaining schemas
         for i, other_processor in enumerate(processed_schemas[1:], start=1):
             path_stem = Path(paths[i]).stem
@@ -812,18 +1132,18 @@ class LinkMLProcessor:
             # Handle main sections
             for section in ["classes", "slots", "types", "enums"]:
                 if section in other_processor.schema_dict:
+                    existing = concatenated[section]
                     for key, value in other_processor.schema_dict[section].items():
                         # Create unique key if name conflicts
-                        new_key = f"{key}_{path_stem}" if key in concatenated[section] else key
-                        concatenated[section][new_key] = value
+                        new_key = f"{key}_{path_stem}" if key in existing else key
+                        existing[new_key] = value
 
             # Handle subsets specially
             if "subsets" in other_processor.schema_dict:
+                existing = concatenated["subsets"]
                 for key in other_processor.schema_dict["subsets"]:
-                    new_key = f"{key}_{path_stem}" if key in concatenated["subsets"] else key
-                    # Use the same empty value format as the base schema
-                    empty_format = base_structure["empty_values"].get("subsets", {}).get(key)
-                    concatenated["subsets"][new_key] = empty_format
+                    new_key = f"{key}_{path_stem}" if key in existing else key
+                    existing[new_key] = subset_formats.get(key)
 
         if return_errors:
             return concatenated, errors
@@ -836,39 +1156,51 @@ class LinkMLProcessor:
         Returns:
             Dict containing metadata about the schema structure including:
             - order of sections
-            - format of values (null vs empty)
+            - format of subset values (null vs empty)
             - indentation and formatting patterns
+
+            The result is computed once per ``schema_dict`` and shared between
+            callers, so it must not be modified.
         """
+        # Keyed on the dict itself: combining swaps in a canonicalized copy
+        cached = self._structure
+        if cached is not None and cached[0] is self.schema_dict:
+            return cached[1]
+
         structure = {
             "order": list(self.schema_dict.keys()),
             "empty_values": {},
             "section_formats": {},
         }
 
-        # Analyze how empty values are represented in each section
+        # Record section format (dict, list, etc)
         for section, content in self.schema_dict.items():
-            if isinstance(content, dict):
-                empty_format = {}
-                for key, value in content.items():
-                    if value is None or value == "" or (isinstance(value, dict) and not value):
-                        empty_format[key] = value
-                structure["empty_values"][section] = empty_format
-
-            # Record section format (dict, list, etc)
             structure["section_formats"][section] = type(content)
 
+        # Analyze how empty values are represented; only subsets are rebuilt from them
+        content = self.schema_dict.get("subsets")
+        if isinstance(content, dict):
+            structure["empty_values"]["subsets"] = {
+                key: value
+                for key, value in content.items()
+                if value is None or value == "" or (isinstance(value, dict) and not value)
+            }
+
+        self._structure = (self.schema_dict, structure)
         return structure
 
     def subset_by_class(self, class_names: List[str], include_inherited: bool = True) -> Dict:
         """
         Create a subset of the schema containing only specified classes and their dependencies,
         while preserving the original schema structure and metadata.
+
+        Element definitions in the subset are shared with ``schema_dict``, not copied.
         """
         # First analyze the original schema structure
         original_structure = self.analyze_schema_structure()
 
         # Create new dict following original order
-        subsetted = OrderedDict()
+        subsetted = {}
 
         # Track required components
         required_classes = set()
@@ -877,55 +1209,59 @@ class LinkMLProcessor:
         required_enums = set()
         required_subsets = set()
 
-        def add_class_and_deps(class_name: str):
-            if class_name not in self.schema_view.all_classes():
-                return
-
-            class_def = self.schema_view.get_class(class_name)
+        # Consulted for every class and slot range; fetch the element tables once
+        all_classes = self.schema_view.all_classes()
+        all_types = frozenset(self.schema_view.all_types())
+        all_enums = frozenset(self.schema_view.all_enums())
+
+        def add_subsets(element):
+            # Track subsets used by a class or slot
+            in_subset = getattr(element, "in_subset", None)
+            if isinstance(in_subset, list):
+                required_subsets.update(in_subset)
+            elif in_subset:
+                required_subsets.add(in_subset)
+
+        # Walk classes breadth-first, visiting each class and slot only once
+        seen_slots = set()
+        pending = deque(class_names)
+        while pending:
+            class_name = pending.popleft()
+            if class_name in required_classes or class_name not in all_classes:
+                continue
+
+            class_def = all_classes[class_name]
             required_classes.add(class_name)
+            add_subsets(class_def)
 
-            # Track subsets used by the class
-            if hasattr(class_def, "in_subset"):
-                if isinstance(class_def.in_subset, list):
-                    required_subsets.update(class_def.in_subset)
-                elif class_def.in_subset:
-                    required_subsets.add(class_def.in_subset)
-
-            # Add parent class if inheritance is included
-            if include_inherited and class_def.is_a:
-                add_class_and_deps(class_def.is_a)
-
-            # Add mixin classes
-            if include_inherited and class_def.mixins:
-                for mixin in class_def.mixins:
-                    add_class_and_deps(mixin)
+            # Add parent and mixin classes if inheritance is included
+            if include_inherited:
+                if class_def.is_a:
+                    pending.append(class_def.is_a)
+                if class_def.mixins:
+                    pending.extend(class_def.mixins)
 
             # Add slots used by the class
-            slots = self.schema_view.class_slots(class_name)
-            for slot_name in slots:
+            for slot_name in self.schema_view.class_slots(class_name):
+                if slot_name in seen_slots:
+                    continue
+                seen_slots.add(slot_name)
+
                 slot_def = self.schema_view.get_slot(slot_name)
-                if slot_def:
-                    required_slots.add(slot_name)
-
-                    # Track subsets used by the slot
-                    if hasattr(slot_def, "in_subset"):
-                        if isinstance(slot_def.in_subset, list):
-                            required_subsets.update(slot_def.in_subset)
-                        elif slot_def.in_subset:
-                            required_subsets.add(slot_def.in_subset)
-
-                    # Add slot range dependencies
-                    if slot_def.range:
-                        if slot_def.range in self.schema_view.all_classes():
-                            add_class_and_deps(slot_def.range)
-                        elif slot_def.range in self.schema_view.all_types():
-                            required_types.add(slot_def.range)
-                        elif slot_def.range in self.schema_view.all_enums():
-                            required_enums.add(slot_def.range)
-
-        # Process requested classes
-        for class_name in class_names:
-            add_class_and_deps(class_name)
+                if not slot_def:
+                    continue
+                required_slots.add(slot_name)
+                add_subsets(slot_def)
+
+                # Add slot range dependencies
+                slot_range = slot_def.range
+                if slot_range:
+                    if slot_range in all_classes:
+                        pending.append(slot_range)
+                    elif slot_range in all_types:
+                        required_types.add(slot_range)
+                    elif slot_range in all_enums:
+                        required_enums.add(slot_range)
 
         # Follow original schema order and formats
         for section in original_structure["order"]:
@@ -934,131 +1270,107 @@ class LinkMLProcessor:
             if section == "subsets":
                 # Preserve all original subsets with their original empty value format
                 if "subsets" in self.schema_dict:
-                    subsetted["subsets"] = OrderedDict()
+                    subsetted["subsets"] = {}
                     for k, v in self.schema_dict["subsets"].items():
                         # Use original empty value format
                         empty_format = original_structure["empty_values"].get("subsets", {}).get(k)
                         subsetted["subsets"][k] = empty_format
 
             elif section == "classes" and required_classes:
-                subsetted["classes"] = OrderedDict(
-                    (k, dict(v) if isinstance(v, dict) else v)
-                    for k, v in original_content.items()
-                    if k in required_classes
-                )
+                subsetted["classes"] = {
+                    k: v for k, v in original_content.items() if k in required_classes
+                }
 
             elif section == "slots" and required_slots:
-                subsetted["slots"] = OrderedDict(
-                    (k, dict(v) if isinstance(v, dict) else v)
-                    for k, v in original_content.items()
-                    if k in required_slots
-                )
+                subsetted["slots"] = {
+                    k: v for k, v in original_content.items() if k in required_slots
+                }
 
             elif section == "types":
                 # Handle both imported and required types
-                subsetted["types"] = OrderedDict()
+                subsetted["types"] = {}
                 for k, v in original_content.items():
                     if (
                         isinstance(v, dict)
                         and v.get("from_schema") == "https://w3id.org/linkml/types"
                     ) or k in required_types:
-                        subsetted["types"][k] = dict(v) if isinstance(v, dict) else v
+                        subsetted["types"][k] = v
 
             elif section == "enums" and required_enums:
-                subsetted["enums"] = OrderedDict(
-                    (k, dict(v) if isinstance(v, dict) else v)
-                    for k, v in original_content.items()
-                    if k in required_enums
-                )
+                subsetted["enums"] = {
+                    k: v for k, v in original_content.items() if k in required_enums
+                }
             else:
                 # Copy other sections exactly as they are
                 if section in self.schema_dict:
                     value = self.schema_dict[section]
                     if isinstance(value, dict):
-                        subsetted[section] = OrderedDict(value)
+                        subsetted[section] = dict(value)
                     else:
                         subsetted[section] = value
 
         # Add subsetting note to description
-        if "description" in subsetted:
-            desc = subsetted["description"]
-            if not isinstance(desc, str):
-                desc = str(desc)
-
-            # Remove any existing lines about being a subset
-            desc_lines = [
-                line for line in desc.split("\n") if "subset of the original schema" not in line
-            ]
-
-            # Add new subset description line
-            subset_line = f"This is a subset of the original schema containing the following classes: {', '.join(sorted(class_names))}."
-
-            # Ensure no duplicates are added
-            if subset_line not in desc_lines:
-                if not desc.endswith("\n"):
-                    desc_lines.append("")
-                desc_lines.append(subset_line)
-
-            subsetted["description"] = "\n".join(desc_lines).strip()
+        _apply_subset_description(subsetted, class_names)
 
         return subsetted
 
-    def generate_class_hierarchy_text(self) -> str:
-        """
-        Generate a text-based representation of the class hierarchy.
+    def _compute_hierarchy(self, all_classes: Dict) -> Dict[Optional[str], List[str]]:
+        """Map each parent class name to its sorted direct subclasses."""
+        hierarchy = defaultdict(list)
+        for class_name, class_def in all_classes.items():
+            # Root classes (no parent) are collected under None
+            hierarchy[class_def.is_a or None].append(class_name)
 
-        Returns:
-            str: Text representation of class hierarchy
-        """
-        # Prepare class hierarchy
-        hierarchy = {}
-        for class_name, class_def in self.schema_view.all_classes().items():
-            parent = getattr(class_def, "is_a", None)
+        for children in hierarchy.values():
+            children.sort()
+        return hierarchy
+
+    def _build_hierarchy_lines(self) -> Iterator[str]:
+        """Render the class hierarchy as tree lines, one block per root class."""
+        all_classes = self.schema_view.all_classes()
+        hierarchy = self._compute_hierarchy(all_classes)
 
-            if parent not in hierarchy:
-                hierarchy[parent] = []
-            hierarchy.setdefault(parent, []).append(class_name)
+        # Pending (class, indent, is_last) entries, next one to render on top
+        stack = []
 
-        def generate_tree(parent=None, indent=""):
-            tree_lines = []
+        def push_children(parent, indent):
             children = hierarchy.get(parent, [])
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], indent, i == last))
+
+        # Generate full hierarchy starting from root classes (no parent)
+        for root in hierarchy.get(None, []):
+            yield f"{root}"
+            push_children(root, "")
+            while stack:
+                child, indent, is_last = stack.pop()
 
-            for i, child in enumerate(sorted(children)):
                 # Determine class type annotations
-                class_def = self.schema_view.get_class(child)
+                class_def = all_classes[child]
                 type_annotation = ""
-                if getattr(class_def, "mixin", False):
+                if class_def.mixin:
                     type_annotation = " (Mixin)"
-                elif getattr(class_def, "abstract", False):
+                elif class_def.abstract:
                     type_annotation = " (Abstract)"
 
                 # Last child uses different tree connection
-                if i == len(children) - 1:
-                    tree_lines.append(f"{indent}└── {child}{type_annotation}")
-                    child_indent = indent + "    "
+                if is_last:
+                    yield f"{indent}└── {child}{type_annotation}"
+                    push_children(child, indent + "    ")
                 else:
-                    tree_lines.append(f"{indent}├── {child}{type_annotation}")
-                    child_indent = indent + "│   "
-
-                # Recursively generate subtree
-                tree_lines.extend(generate_tree(child, child_indent))
+                    yield f"{indent}├── {child}{type_annotation}"
+                    push_children(child, indent + "│   ")
+            yield ""  # Separator between root trees
 
-            return tree_lines
-
-        # Generate full hierarchy starting from root classes (no parent)
-        full_tree_lines = []
-        root_classes = [
-            cls
-            for cls, class_def in self.schema_view.all_classes().items()
-            if not getattr(class_def, "is_a", None)
-        ]
-
-        for root in sorted(root_classes):
-            full_tree_lines.append(f"{root}")
-            full_tree_lines.extend(generate_tree(root))
-            full_tree_lines.append("")  # Separator between root trees
+    def generate_class_hierarchy_text(self) -> str:
+        """
+        Generate a text-based representation of the class hierarchy.
 
-        return "\n".join(full_tree_lines)
+        Returns:
+            str: Text representation of class hierarchy
+        """
+        return "\n".join(self._build_hierarchy_lines())
 
     def save_class_hierarchy_diagram(self, output_path: Union[str, Path]):
         """
@@ -1067,62 +1379,7 @@ class LinkMLProcessor:
         Args:
             output_path (Union[str, Path]): Path to save the diagram
         """
-        output_path = Path(output_path)
-
-        # Prepare class hierarchy
-        hierarchy = {}
-        for class_name, class_def in self.schema_view.all_classes().items():
-            parent = getattr(class_def, "is_a", None)
-
-            if parent not in hierarchy:
-                hierarchy[parent] = []
-            hierarchy.setdefault(parent, []).append(class_name)
-
-        def generate_tree(parent=None, indent=""):
-            tree_lines = []
-            children = hierarchy.get(parent, [])
-
-            for i, child in enumerate(sorted(children)):
-                # Determine class type annotations
-                class_def = self.schema_view.get_class(child)
-                type_annotation = ""
-                if getattr(class_def, "mixin", False):
-                    type_annotation = " (Mixin)"
-                elif getattr(class_def, "abstract", False):
-                    type_annotation = " (Abstract)"
-
-                # Last child uses different tree connection
-                if i == len(children) - 1:
-                    tree_lines.append(f"{indent}└── {child}{type_annotation}")
-                    child_indent = indent + "    "
-                else:
-                    tree_lines.append(f"{indent}├── {child}{type_annotation}")
-                    child_indent = indent + "│   "
-
-                # Recursively generate subtree
-                tree_lines.extend(generate_tree(child, child_indent))
-
-            return tree_lines
-
-        # Generate full hierarchy starting from root classes (no parent)
-        full_tree_lines = []
-        root_classes = [
-            cls
-            for cls, class_def in self.schema_view.all_classes().items()
-            if not getattr(class_def, "is_a", None)
-        ]
-
-        for root in sorted(root_classes):
-            full_tree_lines.append(f"{root}")
-            full_tree_lines.extend(generate_tree(root))
-            full_tree_lines.append("")  # Separator between root trees
-
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write to file
-        with open(output_path, "w") as f:
-            f.write("\n".join(full_tree_lines))
+        _write_lines(output_path, self._build_hierarchy_lines())
 
     def save_class_diagram(self, class_name: str, output_path: Union[str, Path]):
         """
@@ -1140,39 +1397,39 @@ class LinkMLProcessor:
         if not class_def:
             raise ValueError(f"Class '{class_name}' not found in schema")
 
-        # Prepare class details
-        details = [
-            f"Class: {class_name}",
-            f"Description: {getattr(class_def, 'description', 'No description available')}",
-        ]
+        _write_lines(output_path, self._class_diagram_lines(class_name, class_def))
+
+    def _class_diagram_lines(self, class_name: str, class_def: Any) -> Iterator[str]:
+        """Yield the lines of the detailed diagram for one class."""
+        # Class details
+        yield f"Class: {class_name}"
+        yield f"Description: {getattr(class_def, 'description', 'No description available')}"
 
         # Add class type information
-        if getattr(class_def, "abstract", False):
-            details.append("Type: Abstract Class")
-        elif getattr(class_def, "mixin", False):
-            details.append("Type: Mixin Class")
+        if class_def.abstract:
+            yield "Type: Abstract Class"
+        elif class_def.mixin:
+            yield "Type: Mixin Class"
 
         # Add inheritance information
-        parent = getattr(class_def, "is_a", None)
+        parent = class_def.is_a
         if parent:
-            details.append(f"Inherits from: {parent}")
+            yield f"Inherits from: {parent}"
 
         # Add mixins
-        mixins = getattr(class_def, "mixins", [])
+        mixins = class_def.mixins
         if mixins:
-            details.append(f"Mixins: {', '.join(mixins)}")
+            yield f"Mixins: {', '.join(mixins)}"
 
         # Add slots
-        details.append("\nSlots:")
+        yield "\nSlots:"
         for slot_name in self.schema_view.class_slots(class_name):
             slot_def = self.schema_view.get_slot(slot_name)
-
-            # Prepare slot details
-            slot_info = [slot_name]
+            yield slot_name
 
             # Add range
             range_info = slot_def.range or "Any"
-            slot_info.append(f"  Range: {range_info}")
+            yield f"  Range: {range_info}"
 
             # Add constraints
             constraints = []
@@ -1182,22 +1439,13 @@ class LinkMLProcessor:
                 constraints.append("multivalued")
 
             if constraints:
-                slot_info.append(f"  Constraints: {', '.join(constraints)}")
+                yield f"  Constraints: {', '.join(constraints)}"
 
             # Add description if available
             if slot_def.description:
-                slot_info.append(f"  Description: {slot_def.description}")
-
-            details.extend(slot_info)
-            details.append("")  # Empty line between slots
+                yield f"  Description: {slot_def.description}"
 
-        # Ensure parent directory exists
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write to file
-        with open(output_path, "w") as f:
-            f.write("\n".join(details))
+            yield ""  # Empty line between slots
 
     def subset_schema(self, class_names: List[str], include_inherited: bool = True) -> Dict:
         """
@@ -1219,33 +1467,50 @@ class LinkMLProcessor:
         if not valid_classes:
             raise ValueError(f"No valid classes found. Specified classes: {class_names}")
 
-        # Create subset using analyze_schema_structure and subset logic
-        subsetted = self.subset_by_class(valid_classes, include_inherited)
+        # Create subset using analyze_schema_structure and subset logic;
+        # this also adds the subset note to the description
+        return self.subset_by_class(valid_classes, include_inherited)
 
-        # Update description to indicate this is a subset
-        # When adding the subset description
-        if "description" in subsetted:
-            desc = subsetted["description"]
-            if not isinstance(desc, str):
-                desc = str(desc)
 
-            # Remove any existing lines about being a subset
-            desc_lines = [
-                line for line in desc.split("\n") if "subset of the original schema" not in line
-            ]
+try:
+    # libyaml emitter; representers below still run in Python
+    _BaseDumper = yaml.CDumper
+    _NO_WRAP = -1
+except AttributeError:  # PyYAML built without libyaml
+    _BaseDumper = yaml.Dumper
+    _NO_WRAP = float("inf")
 
-            # Add new subset description line
-            subset_line = f"This is a subset of the original schema containing the following classes: {', '.join(sorted(class_names))}."
 
-            # Ensure no duplicates are added
-            if subset_line not in desc_lines:
-                if not desc.endswith("\n"):
-                    desc_lines.append("")
-                desc_lines.append(subset_line)
+class StructurePreservingDumper(_BaseDumper):
+    """Custom YAML dumper that preserves structure and empty values."""
 
-            subsetted["description"] = "\n".join(desc_lines).strip()
+    def ignore_aliases(self, data):
+        """Write shared objects (e.g. interned fragments) out in full, never as aliases."""
+        return True
+
+    def represent_none(self, _):
+        """Represent None as empty string."""
+        return self.represent_scalar("tag:yaml.org,2002:null", "")
+
+    def represent_dict(self, data):
+        """Preserve order of dictionary items."""
+        return self.represent_mapping("tag:yaml.org,2002:map", data.items())
+
+    def represent_str(self, data):
+        """Handle string serialization with proper quotation."""
+        style = None
+        if "\n" in data:  # Use literal block for multiline
+            style = "|"
+        elif ":" in data or "#" in data:  # Quote strings containing special characters
+            style = '"'
+        return self.represent_scalar("tag:yaml.org,2002:str", data, style=style)
 
-        return subsetted
+
+# Register representers
+StructurePreservingDumper.add_representer(type(None), StructurePreservingDumper.represent_none)
+StructurePreservingDumper.add_representer(OrderedDict, StructurePreservingDumper.represent_dict)
+StructurePreservingDumper.add_representer(dict, StructurePreservingDumper.represent_dict)
+StructurePreservingDumper.add_representer(str, StructurePreservingDumper.represent_str)
 
 
 def save_yaml(data: Dict, path: Union[str, Path]) -> None:
@@ -1256,33 +1521,6 @@ def save_yaml(data: Dict, path: Union[str, Path]) -> None:
         data: Dictionary to save
         path: Path to save the YAML file
     """
-
-    class StructurePreservingDumper(yaml.Dumper):
-        """Custom YAML dumper that preserves structure and empty values."""
-
-        def represent_none(self, _):
-            """Represent None as empty string."""
-            return self.represent_scalar("tag:yaml.org,2002:null", "")
-
-        def represent_dict(self, data):
-            """Preserve order of dictionary items."""
-            return self.represent_mapping("tag:yaml.org,2002:map", data.items())
-
-        def represent_str(self, data):
-            """Handle string serialization with proper quotation."""
-            style = None
-            if "\n" in data:  # Use literal block for multiline
-                style = "|"
-            elif ":" in data or "#" in data:  # Quote strings containing special characters
-                style = '"'
-            return self.represent_scalar("tag:yaml.org,2002:str", data, style=style)
-
-    # Register representers
-    StructurePreservingDumper.add_representer(type(None), StructurePreservingDumper.represent_none)
-    StructurePreservingDumper.add_representer(OrderedDict, StructurePreservingDumper.represent_dict)
-    StructurePreservingDumper.add_representer(dict, StructurePreservingDumper.represent_dict)
-    StructurePreservingDumper.add_representer(str, StructurePreservingDumper.represent_str)
-
     # Ensure path parent exists
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -1297,7 +1535,7 @@ def save_yaml(data: Dict, path: Union[str, Path]) -> None:
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
-                width=float("inf"),  # Prevent line wrapping
+                width=_NO_WRAP,  # Prevent line wrapping
             )
     except Exception as e:
         logger.error(f"Error saving YAML to {path}: {e}")
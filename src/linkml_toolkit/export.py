@@ -6,10 +6,9 @@ from typing import Union, Dict, Optional, List
 import logging
 import json
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from linkml_runtime.utils.schemaview import SchemaView
-from linkml.generators.jsonschemagen import JsonSchemaGenerator
-from linkml.generators.rdfgen import RDFGenerator
-from linkml.generators.graphqlgen import GraphqlGenerator
+from linkml_runtime.linkml_model import SchemaDefinition
 from .sql import SQLExporter, SQLDialect
 
 logger = logging.getLogger(__name__)
@@ -17,10 +16,24 @@ logger = logging.getLogger(__name__)
 class SchemaExporter:
     """Export LinkML schemas to various formats."""
     
-    def __init__(self, schema_path: Union[str, Path]):
-        """Initialize the schema exporter."""
+    def __init__(self, schema_path: Union[str, Path], schema_dict: Optional[Dict] = None):
+        """Initialize the schema exporter.
+
+        Args:
+            schema_path: Path to the LinkML schema file
+            schema_dict: Already-parsed content of schema_path, used instead of
+                reading the file again
+        """
         self.schema_path = Path(schema_path)
-        self.schema_view = SchemaView(str(schema_path))
+        if schema_dict is None:
+            self.schema_view = SchemaView(str(schema_path))
+        else:
+            from linkml_runtime.loaders.yaml_loader import YAMLLoader
+
+            schema = YAMLLoader().load(schema_dict, target_class=SchemaDefinition)
+            # Local imports resolve against the schema file, as when loading the path
+            schema.source_file = str(schema_path)
+            self.schema_view = SchemaView(schema)
     
     def to_rdf(self, output_path: Union[str, Path], format: str = 'turtle') -> None:
         """Export schema to RDF."""
@@ -73,6 +86,9 @@ class SchemaExporter:
     
     def to_json_schema(self, output_path: Union[str, Path]) -> None:
         """Export schema to JSON Schema."""
+        # linkml generators are slow to import; only load them when exporting
+        from linkml.generators.jsonschemagen import JsonSchemaGenerator
+
         output_path = Path(output_path)
         generator = JsonSchemaGenerator(self.schema_view.schema)
         json_schema = generator.serialize()
@@ -83,6 +99,8 @@ class SchemaExporter:
     
     def to_graphql(self, output_path: Union[str, Path]) -> None:
         """Export schema to GraphQL."""
+        from linkml.generators.graphqlgen import GraphqlGenerator
+
         output_path = Path(output_path)
         generator = GraphqlGenerator(self.schema_view.schema)
         graphql_schema = generator.serialize()
@@ -91,6 +109,45 @@ class SchemaExporter:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(graphql_schema)
 
+    # File extensions used by to_all_formats for each RDF serialization.
+    RDF_EXTENSIONS = {'turtle': 'ttl', 'xml': 'rdf', 'n3': 'n3', 'nt': 'nt'}
+
+    def to_all_formats(self, output_dir: Union[str, Path], rdf_format: str = 'turtle') -> List[Path]:
+        """Export schema to JSON Schema, RDF and GraphQL in one pass.
+
+        The schema is parsed once and the three independent exports run
+        concurrently against the shared SchemaView.
+
+        Args:
+            output_dir: Directory where the exported files will be created
+            rdf_format: RDF serialization format
+
+        Returns:
+            List of written file paths (JSON Schema, RDF, GraphQL)
+        """
+        output_dir = Path(output_dir)
+        if output_dir.exists() and not output_dir.is_dir():
+            raise ValueError(f"Output path {output_dir} must be a directory.")
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        stem = self.schema_path.stem
+        json_path = output_dir / f'{stem}.json'
+        rdf_path = output_dir / f"{stem}.{self.RDF_EXTENSIONS.get(rdf_format, 'rdf')}"
+        graphql_path = output_dir / f'{stem}.graphql'
+
+        tasks = [
+            (self.to_json_schema, (json_path,), {}),
+            (self.to_rdf, (rdf_path,), {'format': rdf_format}),
+            (self.to_graphql, (graphql_path,), {}),
+        ]
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(fn, *args, **kwargs) for fn, args, kwargs in tasks]
+            # Re-raise the first failure, if any
+            for future in futures:
+                future.result()
+
+        return [json_path, rdf_path, graphql_path]
+
     def to_sql(self, output_path: Union[str, Path], dialect: str = 'postgresql') -> None:
         """Export schema to SQL DDL statements.
         
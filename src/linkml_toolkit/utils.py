@@ -3,11 +3,63 @@
 
 from pathlib import Path
 from typing import Dict, Any, Union, List
+import hashlib
+import json
+import os
 import yaml
 import logging
 
+try:
+    # libyaml-backed loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+
+    HAVE_LIBYAML = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+    HAVE_LIBYAML = False
+
+try:
+    # Optional (the "fast" extra); decodes JSON several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+if not HAVE_LIBYAML:
+    logger.debug("PyYAML was built without libyaml; using the slower pure-Python loader")
+
+# JSON text of schemas parsed by this process, keyed by their on-disk cache path
+# and kept in least-recently-used order
+_PARSED_SCHEMAS: Dict[Path, str] = {}
+PARSED_SCHEMA_MEMO_SIZE = 256
+
+# Most parsed schemas kept in the user cache directory; the oldest are removed first
+SCHEMA_CACHE_MAX_ENTRIES = 512
+
+# Name prefix of the temporary files '--schema -' spools stdin to. Each run gets a
+# new path that is deleted afterwards, so their parses are never written to disk.
+STDIN_SPOOL_PREFIX = "lmtk-stdin-"
+
+
+def user_cache_path(name: str) -> Path:
+    """
+    Return a per-user cache directory for the toolkit (not created).
+
+    Args:
+        name: Sub-directory for one kind of cached data
+
+    Returns:
+        Path inside the platform's user cache directory
+    """
+    try:
+        from platformdirs import user_cache_dir
+    except ImportError:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        return base / "lmtk" / name
+    return Path(user_cache_dir("lmtk")) / name
+
 
 def load_yaml(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
@@ -23,7 +75,7 @@ def load_yaml(file_path: Union[str, Path]) -> Dict[str, Any]:
 
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            schema = yaml.safe_load(f)
+            schema = yaml.load(f, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML file {file_path}: {str(e)}")
     except Exception as e:
@@ -47,3 +99,118 @@ def save_yaml(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
         raise ValueError(f"Error writing to file {file_path}: {str(e)}")
 
 
+def schema_cache_path(schema_path: Union[str, Path]) -> Path:
+    """Return the JSON cache location for a schema file's current on-disk state."""
+    resolved = Path(schema_path).resolve()
+    stat = resolved.stat()
+    digest = hashlib.blake2b(str(resolved).encode("utf-8"), digest_size=16).hexdigest()
+    return user_cache_path("parsed") / f"{digest}-{stat.st_mtime_ns}-{stat.st_size}.json"
+
+
+def load_yaml_cached(schema_path: Union[str, Path]) -> Any:
+    """
+    Load a YAML schema file, reusing earlier parses of the same file state.
+
+    Parsed content is kept as JSON text, both in memory for the rest of the
+    process (the PARSED_SCHEMA_MEMO_SIZE most recently used files) and in the
+    user cache directory for later runs. The cache key embeds the schema's
+    modification time and size, so an edited schema never hits a stale entry.
+    Writing a new entry removes the file's old ones and keeps the directory to
+    SCHEMA_CACHE_MAX_ENTRIES files; spooled stdin schemas are only memoized in
+    memory. Every call returns a fresh object that callers may modify. Schemas
+    whose content does not survive a JSON round trip (e.g. dates or non-string
+    keys) are parsed each time.
+
+    Args:
+        schema_path: Path to the YAML schema file
+
+    Returns:
+        Parsed YAML content
+    """
+    cache_path = schema_cache_path(schema_path)
+    encoded = _PARSED_SCHEMAS.pop(cache_path, None)
+    if encoded is not None:
+        _PARSED_SCHEMAS[cache_path] = encoded
+        return _loads_json(encoded)
+
+    persist = not Path(schema_path).name.startswith(STDIN_SPOOL_PREFIX)
+    if persist:
+        try:
+            encoded = cache_path.read_text(encoding="utf-8")
+            schema_dict = _loads_json(encoded)
+        except (OSError, ValueError):
+            encoded = None
+
+    if encoded is None:
+        with open(schema_path, encoding="utf-8") as f:
+            schema_dict = yaml.load(f, Loader=SafeLoader)
+        encoded = _json_if_lossless(schema_dict)
+        if encoded is not None and persist:
+            try:
+                # Write atomically so concurrent invocations never read a partial file
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(encoded, encoding="utf-8")
+                os.replace(tmp_path, cache_path)
+                _prune_schema_cache(cache_path)
+            except OSError as e:
+                logger.debug(f"Not caching parsed schema {schema_path}: {e}")
+
+    if encoded is not None:
+        _PARSED_SCHEMAS[cache_path] = encoded
+        if len(_PARSED_SCHEMAS) > PARSED_SCHEMA_MEMO_SIZE:
+            del _PARSED_SCHEMAS[next(iter(_PARSED_SCHEMAS))]
+    return schema_dict
+
+
+def clear_schema_cache() -> None:
+    """Forget schemas parsed by this process (the on-disk cache is left alone)."""
+    _PARSED_SCHEMAS.clear()
+
+
+def _prune_schema_cache(cache_path: Path) -> None:
+    """
+    Remove cache entries for earlier states of the same schema file, then the
+    oldest entries beyond SCHEMA_CACHE_MAX_ENTRIES.
+    """
+    path_digest = cache_path.name.split("-", 1)[0]
+    entries = []
+    for entry in cache_path.parent.glob("*.json"):
+        if entry == cache_path:
+            continue
+        try:
+            if entry.name.startswith(f"{path_digest}-"):
+                entry.unlink()
+            else:
+                entries.append((entry.stat().st_mtime_ns, entry))
+        except OSError:
+            pass
+
+    # The entry just written counts towards the limit
+    excess = len(entries) + 1 - SCHEMA_CACHE_MAX_ENTRIES
+    if excess > 0:
+        for _, stale in sorted(entries)[:excess]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _json_if_lossless(data: Any):
+    """Return data encoded as JSON text, or None if decoding would not give it back."""
+    try:
+        encoded = json.dumps(data)
+    except (TypeError, ValueError):
+        return None
+    return encoded if _loads_json(encoded) == data else None
+
+
+def _loads_json(encoded: str) -> Any:
+    """Decode JSON text into fresh objects, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(encoded)
+        except orjson.JSONDecodeError:
+            # e.g. integers beyond 64 bits, which only the json module accepts
+            pass
+    return json.loads(encoded)
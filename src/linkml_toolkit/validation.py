@@ -5,12 +5,12 @@ from pathlib import Path
 import logging
 from dataclasses import dataclass
 import yaml
-from rich.console import Console
 from linkml_runtime.utils.schemaview import SchemaView
 from linkml_runtime.linkml_model import SchemaDefinition
 
+from .utils import load_yaml_cached
+
 logger = logging.getLogger(__name__)
-console = Console()
 
 
 @dataclass
@@ -31,13 +31,39 @@ class SchemaValidator:
 
     def validate_schema(self, schema_path: Union[str, Path]) -> List[ValidationError]:
         """Validate a LinkML schema file with configurable strictness."""
-        schema_path = Path(schema_path)
-        errors = []
+        return self._validate_schema_file(Path(schema_path))
+
+    def validate_schema_dict(
+        self, schema_dict: dict, schema_path: Union[str, Path]
+    ) -> List[ValidationError]:
+        """Validate already-parsed schema content without reading the file again.
 
+        Args:
+            schema_dict: Parsed content of the schema file (not modified)
+            schema_path: File the content was read from, used for error paths
+        """
+        return self._validate_parsed(schema_dict, Path(schema_path))
+
+    def _validate_schema_file(self, schema_path: Path) -> List[ValidationError]:
+        """Run the full validation pass on a schema file."""
         try:
             # Load and parse the YAML
             schema_dict = self._load_yaml(schema_path)
+        except Exception as e:
+            return [
+                ValidationError(
+                    path=str(schema_path),
+                    message=f"Unexpected error during validation: {str(e)}",
+                    severity="ERROR",
+                )
+            ]
+        return self._validate_parsed(schema_dict, schema_path)
+
+    def _validate_parsed(self, schema_dict, schema_path: Path) -> List[ValidationError]:
+        """Validate parsed schema content."""
+        errors = []
 
+        try:
             # Basic structure validation
             if not isinstance(schema_dict, dict):
                 errors.append(
@@ -49,6 +75,9 @@ class SchemaValidator:
                 )
                 return errors
 
+            # Fill in defaults on a copy; the caller's content is left untouched
+            schema_dict = dict(schema_dict)
+
             # Validate minimal required fields
             if "name" not in schema_dict:
                 errors.append(
@@ -100,8 +129,7 @@ class SchemaValidator:
     def _load_yaml(self, path: Path) -> dict:
         """Load and parse YAML file."""
         try:
-            with open(path, encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return load_yaml_cached(path)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML syntax: {str(e)}")
         except Exception as e:
@@ -229,6 +257,8 @@ class SchemaValidator:
 
 def display_validation_errors(errors):
     """Display validation errors with proper formatting."""
+    from rich.console import Console
+
     console = Console()
 
     error_found = False
@@ -1,20 +1,24 @@
 # File: src/linkml_toolkit/visualization/__init__.py
 """Visualization components for LinkML schemas."""
 
+import importlib
 import logging
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
-from .core import SchemaVisualizer, VisualizationConfig
-from .utils import prepare_visualization_data
-from .components import (
-    generate_element_badges,
-    generate_element_details,
-    generate_class_details,
-    generate_slot_details,
-    generate_enum_details,
-    generate_type_details,
-)
+# Public names and the submodule defining them. The visualizer pulls in the
+# linkml runtime, so submodules are only imported on first attribute access.
+_LAZY_ATTRS = {
+    "SchemaVisualizer": ".core",
+    "VisualizationConfig": ".core",
+    "prepare_visualization_data": ".utils",
+    "generate_element_badges": ".components",
+    "generate_element_details": ".components",
+    "generate_class_details": ".components",
+    "generate_slot_details": ".components",
+    "generate_enum_details": ".components",
+    "generate_type_details": ".components",
+}
 
 __all__ = [
     "SchemaVisualizer",
@@ -27,3 +31,17 @@ __all__ = [
     "generate_enum_details",
     "generate_type_details",
 ]
+
+
+def __getattr__(name):
+    """Import public names lazily (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -110,3 +110,17 @@ def second_schema(test_data_dir):
 def invalid_schema(test_data_dir):
     """Fixture for an invalid schema to test validation."""
     return test_data_dir / "invalid_schema.yaml"
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """
+    Keep the toolkit's on-disk caches inside the test's temporary directory,
+    so tests neither depend on nor modify the user's real cache.
+    """
+    from linkml_toolkit import utils
+
+    cache_dir = tmp_path / "user-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    monkeypatch.setattr(utils, "user_cache_path", lambda name: cache_dir / "lmtk" / name)
+    return cache_dir
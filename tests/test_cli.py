@@ -134,3 +134,159 @@ def test_merge_command(basic_schema, second_schema, tmp_path):
     assert any(
         cls in merged_content for cls in ["Person", "Address"]
     ), "Merged schema missing expected classes"
+
+
+def test_combine_reports_save_failure(basic_schema, second_schema, tmp_path):
+    """Test that a failed write is reported as a save error, not a combine error."""
+    runner = CliRunner()
+
+    # The output path is an existing directory, so writing the file fails
+    result = runner.invoke(
+        main,
+        [
+            "combine",
+            "--schema",
+            str(basic_schema),
+            "--additional-schemas",
+            str(second_schema),
+            "--output",
+            str(tmp_path),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "Error saving combined schema" in result.output
+
+
+def test_analyze_json_output(basic_schema, tmp_path):
+    """Test saving schema analysis as indented and compact JSON."""
+    import json
+
+    runner = CliRunner()
+
+    for extra_args in ([], ["--compact"]):
+        output_path = tmp_path / f"analysis{len(extra_args)}.json"
+        result = runner.invoke(
+            main,
+            ["analyze", "--schema", str(basic_schema), "--output", str(output_path)] + extra_args,
+        )
+        assert result.exit_code == 0, f"Analyze failed: {result.output}"
+
+        data = json.loads(output_path.read_text())
+        assert "Person" in data["classes"], "Person class missing from JSON analysis"
+
+        is_indented = "\n" in output_path.read_text().strip()
+        assert is_indented != bool(extra_args), "Unexpected JSON layout"
+
+
+def test_validate_from_stdin(basic_schema):
+    """Test reading the schema from stdin with --schema -."""
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["validate", "--schema", "-"], input=basic_schema.read_text())
+    assert result.exit_code == 0, result.output
+    assert "validation passed" in result.output
+
+    # Each spooled schema has a new temporary path; none are cached on disk
+    from linkml_toolkit import utils
+
+    assert not list(utils.user_cache_path("parsed").glob("*.json"))
+
+    result = runner.invoke(main, ["validate", "--schema", "missing.yaml"])
+    assert result.exit_code == 2
+    assert "does not exist" in result.output
+
+
+def test_analyze_redirected_output(basic_schema):
+    """Test that analyze prints a TSV summary when stdout is not a terminal."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["analyze", "--schema", str(basic_schema)])
+    assert result.exit_code == 0, result.output
+
+    lines = result.output.strip().splitlines()
+    assert lines[0] == "Section\tCount\tItems"
+    rows = {line.split("\t")[0]: line.split("\t") for line in lines[1:]}
+    assert "Person" in rows["Classes"][2].split(",")
+
+
+def test_cli_import_is_lightweight():
+    """Test that importing the CLI does not load the linkml stack."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, linkml_toolkit.cli; "
+        "print(any(m.split('.')[0] in ('linkml', 'linkml_runtime') for m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+def test_repository_choices_match_exporter():
+    """Test that the CLI repository choices follow the exporter's prefix fields."""
+    from linkml_toolkit.cli import REPOSITORY_CHOICES
+    from linkml_toolkit.export import SchemaExporter
+
+    assert sorted(REPOSITORY_CHOICES) == sorted(SchemaExporter.REPOSITORY_PREFIX_FIELDS)
+
+
+def test_fill_table_plain_text_for_long_tables(monkeypatch):
+    """Test that very long tables are rendered as fixed-width text."""
+    from rich.table import Table
+    from rich.text import Text
+    from linkml_toolkit import cli
+
+    monkeypatch.setattr(cli, "PLAIN_TABLE_MIN_ROWS", 2)
+    table = Table("Name", "Range")
+    assert cli._fill_table(table, [("id", "string")]) is table
+
+    rows = [("id", "string"), ("age", "integer"), ("name", "string")]
+    rendered = cli._fill_table(Table("Name", "Range"), rows)
+    assert isinstance(rendered, Text)
+    assert rendered.plain.splitlines() == [
+        "Name  Range",
+        "id    string",
+        "age   integer",
+        "name  string",
+    ]
+
+
+def test_subset_class_list_cleanup(basic_schema, tmp_path):
+    """Test that blank and repeated entries in --classes are ignored."""
+    runner = CliRunner()
+    output_path = tmp_path / "subset.yaml"
+    result = runner.invoke(
+        main,
+        [
+            "subset",
+            "--schema",
+            str(basic_schema),
+            "--classes",
+            "Person, ,Person,",
+            "-o",
+            str(output_path),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "with classes: Person\n" in result.output
+    assert output_path.exists()
+
+    result = runner.invoke(
+        main, ["subset", "--schema", str(basic_schema), "--classes", " , ", "-o", str(output_path)]
+    )
+    assert result.exit_code == 1
+
+
+def test_json_bytes_matches_stdlib(monkeypatch):
+    """Test that orjson and the standard library fallback write the same JSON."""
+    import sys
+    from datetime import date
+    from linkml_toolkit.cli import _json_bytes
+
+    data = {"name": "Ünïcode", "count": 3, "when": date(2024, 1, 2), "items": {"a": [1, 2]}}
+    fast = {compact: _json_bytes(data, compact=compact) for compact in (False, True)}
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    for compact, expected in fast.items():
+        assert _json_bytes(data, compact=compact) == expected
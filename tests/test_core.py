@@ -90,6 +90,26 @@ def test_analyze_schema_sections(basic_schema):
     assert "classes" not in slots_only
 
 
+def test_analyze_schema_memoized(basic_schema):
+    """Repeated analysis with the same arguments reuses the result."""
+    processor = LinkMLProcessor(basic_schema)
+
+    first = processor.analyze_schema(sections=["classes"])
+    assert processor.analyze_schema(sections=["classes"]) is first
+    assert processor.analyze_schema(sections=["classes"], detailed=True) is not first
+
+
+def test_schema_structure_memoized(basic_schema):
+    """The structure template is reused until schema_dict is replaced."""
+    processor = LinkMLProcessor(basic_schema)
+
+    first = processor.analyze_schema_structure()
+    assert processor.analyze_schema_structure() is first
+
+    processor.schema_dict = dict(processor.schema_dict)
+    assert processor.analyze_schema_structure() is not first
+
+
 def test_subset_schema(basic_schema):
     """Test creating a schema subset."""
     processor = LinkMLProcessor(basic_schema)
@@ -118,3 +138,205 @@ def test_generate_class_hierarchy(basic_schema):
     # Basic checks
     assert isinstance(hierarchy_text, str), "Hierarchy should be a string"
     assert len(hierarchy_text.strip()) > 0, "Hierarchy text should not be empty"
+
+
+def test_schema_cache_reused(basic_schema):
+    """Test that a second load is served from the on-disk schema cache."""
+    from linkml_toolkit.utils import schema_cache_path
+
+    first = LinkMLProcessor(basic_schema, validate=False)
+    assert schema_cache_path(basic_schema).exists(), "Parsed schema was not cached"
+
+    second = LinkMLProcessor(basic_schema, validate=False)
+    assert second.schema_dict == first.schema_dict
+
+
+def test_parsed_schema_memo_returns_fresh_objects(basic_schema):
+    """Test that repeated in-process loads do not share mutable state."""
+    from linkml_toolkit.utils import load_yaml_cached
+
+    first = load_yaml_cached(basic_schema)
+    first["classes"]["Mutated"] = {}
+
+    second = load_yaml_cached(basic_schema)
+    assert "Mutated" not in second["classes"]
+    assert second is not first
+
+
+def test_schema_cache_drops_stale_entries(basic_schema, tmp_path, monkeypatch):
+    """Test that caching an edited schema removes the entry for its old content."""
+    import os
+    from linkml_toolkit import utils
+
+    monkeypatch.setattr(utils, "user_cache_path", lambda name: tmp_path / "cache" / name)
+    schema = tmp_path / "schema.yaml"
+    schema.write_text(Path(basic_schema).read_text())
+
+    utils.load_yaml_cached(schema)
+    old_entry = utils.schema_cache_path(schema)
+    assert old_entry.exists()
+
+    schema.write_text(schema.read_text() + "\n# edited\n")
+    os.utime(schema, ns=(0, 1))
+    utils.load_yaml_cached(schema)
+
+    assert utils.schema_cache_path(schema).exists()
+    assert not old_entry.exists()
+
+
+def test_schema_cache_bounded(basic_schema, tmp_path, monkeypatch):
+    """Test that the on-disk cache keeps at most SCHEMA_CACHE_MAX_ENTRIES entries."""
+    import os
+    from linkml_toolkit import utils
+
+    monkeypatch.setattr(utils, "SCHEMA_CACHE_MAX_ENTRIES", 2)
+    schemas = []
+    for i in range(3):
+        schema = tmp_path / f"schema{i}.yaml"
+        schema.write_text(Path(basic_schema).read_text())
+        utils.load_yaml_cached(schema)
+        # Make the write order unambiguous on coarse-grained filesystems
+        os.utime(utils.schema_cache_path(schema), ns=(i, i))
+        schemas.append(schema)
+
+    assert not utils.schema_cache_path(schemas[0]).exists()
+    assert utils.schema_cache_path(schemas[2]).exists()
+    assert len(list(utils.schema_cache_path(schemas[2]).parent.glob("*.json"))) == 2
+
+
+def test_clear_schema_cache(basic_schema):
+    """Test that clearing the in-process memo forgets parsed schemas."""
+    from linkml_toolkit import utils
+
+    utils.load_yaml_cached(basic_schema)
+    assert utils.schema_cache_path(basic_schema) in utils._PARSED_SCHEMAS
+
+    LinkMLProcessor.clear_schema_cache()
+    assert not utils._PARSED_SCHEMAS
+
+
+def test_analyze_slot_usage_includes_inherited(tmp_path):
+    """Test that slot usage reports classes inheriting the slot and their overrides."""
+    schema = tmp_path / "inherit.yaml"
+    schema.write_text(
+        """
+name: inherit
+id: https://example.org/inherit
+classes:
+  Base:
+    slots:
+      - id
+  Child:
+    is_a: Base
+    slot_usage:
+      id:
+        required: true
+slots:
+  id:
+    range: string
+"""
+    )
+    processor = LinkMLProcessor(schema, validate=False)
+
+    usage = processor.analyze_slot("id")["usage"]
+    assert usage["Base"] == {"own": True, "inherited": False}
+    assert usage["Child"] == {"own": False, "inherited": True, "required": True}
+
+
+def test_schema_view_built_lazily(basic_schema):
+    """Test that the SchemaView is only created when first used."""
+    processor = LinkMLProcessor(basic_schema, validate=False)
+    assert processor._schema_view is None
+
+    view = processor.schema_view
+    assert view is processor.schema_view
+    assert "Person" in view.all_classes()
+
+
+def test_analyze_schema_reports_broken_class(tmp_path):
+    """Test that one class failing analysis does not drop the others."""
+    schema = tmp_path / "broken.yaml"
+    schema.write_text(
+        """
+name: broken
+id: https://example.org/broken
+classes:
+  Good:
+    slots:
+      - id
+  Bad:
+    is_a: Missing
+slots:
+  id:
+    range: string
+"""
+    )
+    processor = LinkMLProcessor(schema, validate=False)
+
+    classes = processor.analyze_schema(sections=["classes"], detailed=True)["classes"]
+    assert "id" in classes["Good"]["slots"]
+    assert classes["Bad"] == {"name": "Bad", "description": "Error analyzing class"}
+
+
+def test_subset_handles_self_referencing_class(tmp_path):
+    """Test that a class whose slot ranges over itself is only visited once."""
+    schema = tmp_path / "cycle.yaml"
+    schema.write_text(
+        """
+name: cycle
+id: https://example.org/cycle
+classes:
+  Person:
+    slots:
+      - knows
+  Robot: {}
+slots:
+  knows:
+    range: Person
+"""
+    )
+    processor = LinkMLProcessor(schema, validate=False)
+
+    subset = processor.subset_by_class(["Person"])
+    assert list(subset["classes"]) == ["Person"]
+    assert list(subset["slots"]) == ["knows"]
+
+
+def test_subset_schema_notes_classes_in_description(basic_schema):
+    """Test that the subset description gets a single note naming the kept classes."""
+    processor = LinkMLProcessor(basic_schema)
+
+    subset = processor.subset_schema(["Person", "Missing"])
+    assert subset["description"] == (
+        "A basic test schema with valid configuration\n\n"
+        "This is a subset of the original schema containing the following classes: Person."
+    )
+
+
+def test_summary_defaults_not_shared():
+    """Test that missing list fields get a fresh default in every summary entry."""
+    from types import SimpleNamespace
+
+    from linkml_toolkit.core import _CLASS_SUMMARY_FIELDS, _summarize
+
+    first = _summarize("A", SimpleNamespace(), _CLASS_SUMMARY_FIELDS)
+    first["slots"].append("leaked")
+
+    second = _summarize("B", SimpleNamespace(), _CLASS_SUMMARY_FIELDS)
+    assert second["slots"] == []
+    assert second["description"] == "" and second["abstract"] is False
+
+
+def test_class_diagram_error_leaves_no_output(basic_schema, tmp_path, monkeypatch):
+    """Test that a failure while rendering a class diagram does not leave a partial file."""
+    processor = LinkMLProcessor(basic_schema)
+    output = tmp_path / "diagrams" / "diagram.txt"
+
+    def fail(slot_name):
+        raise ValueError(f"cannot resolve {slot_name}")
+
+    monkeypatch.setattr(processor.schema_view, "get_slot", fail)
+    with pytest.raises(ValueError):
+        processor.save_class_diagram("Person", output)
+
+    assert list(output.parent.iterdir()) == []
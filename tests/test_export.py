@@ -175,3 +175,65 @@ def test_export_rdf(basic_schema, tmp_path):
         print("\nFull traceback:")
         traceback.print_exc()
         raise
+
+
+def test_export_all_formats(basic_schema, tmp_path):
+    """Test exporting JSON Schema, RDF and GraphQL together."""
+    exporter = SchemaExporter(basic_schema)
+    written = exporter.to_all_formats(tmp_path / "all", rdf_format="turtle")
+
+    assert [p.suffix for p in written] == [".json", ".ttl", ".graphql"]
+    for path in written:
+        assert path.exists(), f"{path.name} not created"
+        assert path.stat().st_size > 0, f"{path.name} is empty"
+
+    assert "$defs" in json.loads(written[0].read_text())
+
+
+def test_export_from_another_directory(tmp_path, monkeypatch):
+    """Test that exports resolve local imports from whichever directory they run in."""
+    schema_dir = tmp_path / "imp"
+    schema_dir.mkdir()
+    (tmp_path / "other").mkdir()
+    (schema_dir / "common.yaml").write_text(
+        """
+id: https://example.org/common
+name: common
+slots:
+  shared:
+    range: string
+"""
+    )
+    (schema_dir / "main.yaml").write_text(
+        """
+id: https://example.org/main
+name: main
+imports:
+  - common
+classes:
+  Thing:
+    slots:
+      - shared
+"""
+    )
+
+    monkeypatch.chdir(schema_dir)
+    SchemaExporter("main.yaml").to_json_schema(tmp_path / "first.json")
+
+    monkeypatch.chdir(tmp_path / "other")
+    SchemaExporter("../imp/main.yaml").to_json_schema(tmp_path / "second.json")
+
+    assert (tmp_path / "second.json").read_text() == (tmp_path / "first.json").read_text()
+
+
+def test_exporter_from_parsed_content(basic_schema, tmp_path):
+    """Test that an exporter built from already-parsed content matches one built from the path."""
+    from linkml_toolkit.utils import load_yaml_cached
+
+    from_path = SchemaExporter(basic_schema)
+    from_dict = SchemaExporter(basic_schema, schema_dict=load_yaml_cached(basic_schema))
+
+    assert from_dict.schema_view.schema == from_path.schema_view.schema
+    from_path.to_json_schema(tmp_path / "path.json")
+    from_dict.to_json_schema(tmp_path / "dict.json")
+    assert (tmp_path / "dict.json").read_text() == (tmp_path / "path.json").read_text()
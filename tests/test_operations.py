@@ -1,5 +1,5 @@
 import pytest
-from linkml_toolkit.core import LinkMLProcessor
+from linkml_toolkit.core import LinkMLProcessor, SchemaInternPool, save_yaml
 
 
 def test_merge_multiple(basic_schema, second_schema):
@@ -38,3 +38,86 @@ def test_concat_multiple(basic_schema, second_schema):
     # Check schema has separate unique elements
     class_names = list(concatenated["classes"].keys())
     assert len(class_names) >= 2, "Concatenation should preserve classes from both schemas"
+
+
+def test_merge_multiple_parallel(basic_schema, second_schema):
+    """Test that pre-parsing schemas in worker processes gives the same merge."""
+    schema_list = f"{basic_schema},{second_schema}"
+
+    serial = LinkMLProcessor.merge_multiple(schema_list, return_errors=False)
+    parallel = LinkMLProcessor.merge_multiple(schema_list, return_errors=False, max_workers=2)
+
+    assert parallel == serial
+
+
+def test_intern_pool_shares_equal_fragments():
+    """Test that structurally equal sub-trees become the same object."""
+    pool = SchemaInternPool()
+    first = pool.canonicalize({"types": {"string": {"uri": "xsd:string"}}, "n": 1})
+    second = pool.canonicalize({"types": {"string": {"uri": "xsd:string"}}, "n": True})
+
+    assert first["types"] is second["types"]
+    assert first is not second
+    assert first == {"types": {"string": {"uri": "xsd:string"}}, "n": 1}
+
+
+def test_load_schema_list_skips_comments(tmp_path, basic_schema, second_schema):
+    """Test that indented comment lines in a schema list file are ignored."""
+    list_file = tmp_path / "schemas.txt"
+    list_file.write_text(f"# schemas\n{basic_schema}\n   # {second_schema}\n\n{second_schema}\n")
+
+    paths = LinkMLProcessor._load_schema_list(str(list_file))
+
+    assert [str(p) for p in paths] == [str(basic_schema), str(second_schema)]
+
+
+def test_merge_multiple_list_metadata_keeps_order(tmp_path):
+    """Test that list metadata is merged without duplicates in first-seen order."""
+    first = tmp_path / "first.yaml"
+    first.write_text(
+        "name: first\nid: https://example.org/first\n"
+        "imports:\n  - linkml:types\n  - common\n"
+        "classes:\n  A:\n    description: A\n"
+    )
+    second = tmp_path / "second.yaml"
+    second.write_text(
+        "name: second\nid: https://example.org/second\n"
+        "imports:\n  - extra\n  - linkml:types\n"
+        "classes:\n  B:\n    description: B\n"
+    )
+
+    merged = LinkMLProcessor.merge_multiple(f"{first},{second}", return_errors=False)
+
+    assert merged["imports"] == ["linkml:types", "common", "extra"]
+
+
+def test_intern_pool_interns_strings():
+    """Test that equal strings from different schemas become one object."""
+    pool = SchemaInternPool()
+    range_name = "".join(["str", "ing"])
+    first = pool.canonicalize({"slots": {"a": {"range": range_name}}})
+    second = pool.canonicalize({"slots": {"b": {"range": "".join(["stri", "ng"])}}})
+
+    assert first["slots"]["a"]["range"] is second["slots"]["b"]["range"]
+
+
+def test_combined_output_has_no_aliases(tmp_path):
+    """Test that shared fragments are written out in full rather than as YAML aliases."""
+    first = tmp_path / "first.yaml"
+    first.write_text(
+        "id: https://example.org/first\nname: first\n"
+        "classes:\n  Person:\n    slots: [id, name]\n  Org:\n    slots: [id, name]\n"
+        "slots:\n  id:\n    range: string\n  name:\n    range: string\n"
+    )
+    second = tmp_path / "second.yaml"
+    second.write_text(
+        "id: https://example.org/second\nname: second\n"
+        "classes:\n  Pet:\n    slots: [id, name]\n"
+        "slots:\n  id:\n    range: string\n  name:\n    range: string\n"
+    )
+
+    for combine in (LinkMLProcessor.merge_multiple, LinkMLProcessor.concat_multiple):
+        output = tmp_path / "combined.yaml"
+        save_yaml(combine(f"{first},{second}", return_errors=False), output)
+        text = output.read_text()
+        assert "&id" not in text and "*id" not in text
@@ -81,3 +81,64 @@ def test_display_validation_errors(basic_schema, invalid_schema):
     # Tests
     assert not error_found, "No errors should be found for a valid schema"
     assert error_found_invalid, "Errors should be found for an invalid schema"
+
+
+def test_validation_rechecks_imported_schemas(tmp_path, monkeypatch):
+    """Test that editing an imported schema is caught by the next validation."""
+    # Local imports resolve against the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "common.yaml").write_text(
+        """
+id: https://example.org/common
+name: common
+slots:
+  shared:
+    range: string
+"""
+    )
+    main = tmp_path / "main.yaml"
+    main.write_text(
+        """
+id: https://example.org/main
+name: main
+imports:
+  - common
+classes:
+  Thing:
+    slots:
+      - shared
+"""
+    )
+
+    assert SchemaValidator().validate_schema(main) == []
+
+    (tmp_path / "common.yaml").write_text(
+        """
+id: https://example.org/common
+name: common
+slots:
+  renamed:
+    range: string
+"""
+    )
+    errors = SchemaValidator().validate_schema(main)
+    assert any("undefined slot 'shared'" in e.message for e in errors)
+
+
+def test_validate_schema_dict(invalid_schema):
+    """Test that validating parsed content matches validating the file."""
+    from pathlib import Path
+
+    import yaml
+
+    validator = SchemaValidator()
+    schema_dict = yaml.safe_load(Path(invalid_schema).read_text())
+    original = dict(schema_dict)
+
+    from_dict = validator.validate_schema_dict(schema_dict, invalid_schema)
+    from_file = validator.validate_schema(invalid_schema)
+
+    assert [(e.severity, e.message) for e in from_dict] == [
+        (e.severity, e.message) for e in from_file
+    ]
+    assert schema_dict == original, "validate_schema_dict modified its input"